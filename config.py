@@ -1,11 +1,21 @@
 """Application configuration."""
+import os
 from pathlib import Path
 
 # Supported formats
 INPUT_FORMATS = [".epub", ".mobi", ".azw", ".azw3", ".pdf", ".txt", ".html", ".docx", ".rtf", ".fb2"]
+INPUT_FORMATS_SET = frozenset(INPUT_FORMATS)
+EBOOK_FILETYPES = ("Ebook files", " ".join(f"*{ext}" for ext in INPUT_FORMATS))
 OUTPUT_FORMATS = ["azw3", "mobi", "epub", "pdf", "txt"]
 DEFAULT_OUTPUT_FORMAT = "azw3"
 
+# Upper bound on ebook-convert processes running at once
+MAX_CONCURRENT_CONVERSIONS = min(4, os.cpu_count() or 1)
+
 # Temp directory for conversions
 TEMP_DIR = Path.home() / ".kindle_sender" / "temp"
-TEMP_DIR.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+# On-disk metadata cache (title/author/cover per book file)
+METADATA_CACHE_DIR = Path.home() / ".kindle_sender" / "meta_cache"
+METADATA_CACHE_MAX_BYTES = 500 * 1024 * 1024
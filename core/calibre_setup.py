@@ -1,9 +1,14 @@
 """Calibre extraction and management."""
+import functools
+import os
 import sys
 import zipfile
 import shutil
 from pathlib import Path
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
 
 # Calibre will live here
 APP_DATA = Path.home() / "AppData" / "Local" / "KindleSender"
@@ -15,10 +20,13 @@ CURRENT_VERSION = "1"
 DEBUG = not getattr(sys, 'frozen', False)
 
 
-def _debug(msg):
-    """Print debug message if debug mode is on."""
+def _debug(msg, *args):
+    """Print debug message if debug mode is on.
+
+    Formatting args are %-substituted only when the message is printed.
+    """
     if DEBUG:
-        print(msg)
+        print(msg % args if args else msg)
 
 
 def get_bundled_zip() -> Path:
@@ -28,26 +36,30 @@ def get_bundled_zip() -> Path:
     return Path(__file__).parent.parent / "calibre.zip"
 
 
+@functools.lru_cache(maxsize=1)
 def is_ready() -> bool:
     """Check if Calibre is extracted and ready."""
-    exe = CALIBRE_DIR / "ebook-convert.exe"
-    app_folder = CALIBRE_DIR / "app"
-
-    _debug(f"[DEBUG] Checking Calibre at: {CALIBRE_DIR}")
-    _debug(f"[DEBUG] ebook-convert.exe exists: {exe.exists()}")
-    _debug(f"[DEBUG] app folder exists: {app_folder.exists()}")
+    _debug("[DEBUG] Checking Calibre at: %s", CALIBRE_DIR)
+
+    # One directory read instead of a stat per marker file
+    try:
+        with os.scandir(CALIBRE_DIR) as it:
+            names = {e.name for e in it}
+    except OSError:
+        _debug("[DEBUG] is_ready: False (calibre folder missing)")
+        return False
 
-    if not exe.exists():
+    if "ebook-convert.exe" not in names:
         _debug("[DEBUG] is_ready: False (exe missing)")
         return False
 
-    if not app_folder.exists():
+    if "app" not in names:
         _debug("[DEBUG] is_ready: False (app folder missing)")
         return False
 
-    if VERSION_FILE.exists():
+    if ".installed_version" in names:
         current = VERSION_FILE.read_text().strip()
-        _debug(f"[DEBUG] Version file: {current}, Expected: {CURRENT_VERSION}")
+        _debug("[DEBUG] Version file: %s, Expected: %s", current, CURRENT_VERSION)
         if current == CURRENT_VERSION:
             _debug("[DEBUG] is_ready: True")
             return True
@@ -56,12 +68,45 @@ def is_ready() -> bool:
     return False
 
 
+# Characters Windows doesn't allow in file names; ZipFile.extract maps them to "_"
+_WINDOWS_ILLEGAL = str.maketrans(':<>|"?*', '_' * 7)
+
+
+def _member_path(dest: Path, name: str) -> Optional[Path]:
+    """Where ZipFile.extract would write member name under dest.
+
+    Drive letters, absolute paths and "."/".." components are dropped the same
+    way, so no member can land outside dest. None if nothing is left.
+    """
+    name = name.replace('/', os.path.sep)
+    if os.path.altsep:
+        name = name.replace(os.path.altsep, os.path.sep)
+    name = os.path.splitdrive(name)[1]
+    parts = [p for p in name.split(os.path.sep) if p not in ('', os.path.curdir, os.path.pardir)]
+    if os.path.sep == '\\':
+        parts = [p.translate(_WINDOWS_ILLEGAL).rstrip('.') for p in parts]
+        parts = [p for p in parts if p]
+    return dest.joinpath(*parts) if parts else None
+
+
+def _extract_one(open_zip, info: zipfile.ZipInfo, target: Path):
+    """Extract a single member using the calling thread's own ZipFile handle."""
+    if info.file_size == 0:
+        target.touch()
+        return
+
+    zf = open_zip()
+    # Size the copy buffer to the member so small files are a single read
+    with zf.open(info) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, min(info.file_size, 1 << 20))
+
+
 def extract(progress_callback=None):
     """Extract Calibre to AppData."""
     zip_path = get_bundled_zip()
 
-    _debug(f"[DEBUG] Extracting from: {zip_path}")
-    _debug(f"[DEBUG] Extracting to: {CALIBRE_DIR}")
+    _debug("[DEBUG] Extracting from: %s", zip_path)
+    _debug("[DEBUG] Extracting to: %s", CALIBRE_DIR)
 
     if not zip_path.exists():
         raise FileNotFoundError(f"calibre.zip not found: {zip_path}")
@@ -80,22 +125,69 @@ def extract(progress_callback=None):
         progress_callback(10, "Extracting Calibre tools...")
 
     with zipfile.ZipFile(zip_path, 'r') as zf:
-        members = zf.namelist()
-        total = len(members)
-        _debug(f"[DEBUG] Extracting {total} files...")
-
-        for i, member in enumerate(members):
-            zf.extract(member, CALIBRE_DIR)
+        members = zf.infolist()
+
+    # Create directories up front so workers never race on mkdir
+    files = []
+    dirs = set()
+    for info in members:
+        target = _member_path(CALIBRE_DIR, info.filename)
+        if target is None:
+            continue
+        if info.is_dir():
+            dirs.add(target)
+        else:
+            files.append((info, target))
+            dirs.add(target.parent)
+    for d in sorted(dirs):
+        d.mkdir(parents=True, exist_ok=True)
+
+    total = len(files)
+    _debug("[DEBUG] Extracting %d files...", total)
+
+    # ZipFile isn't safe to share between threads, so each worker opens its own
+    local = threading.local()
+    handles = []
+
+    def open_zip():
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(zip_path, 'r')
+            handles.append(zf)
+        return zf
+
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(_extract_one, open_zip, info, target) for info, target in files]
+
+            last = time.monotonic()
+            for i, future in enumerate(as_completed(futures), 1):
+                future.result()
+
+                # Throttle to ~20 updates/sec so tiny members don't flood the UI
+                now = time.monotonic()
+                if progress_callback and now - last > 0.05:
+                    pct = 10 + int((i / total) * 85)
+                    progress_callback(pct, f"Extracting... ({i}/{total})")
+                    last = now
+    finally:
+        # Don't leave calibre.zip open (on Windows that blocks replacing it)
+        for zf in handles:
+            zf.close()
 
-            if progress_callback and i % 100 == 0:
-                pct = 10 + int((i / total) * 85)
-                progress_callback(pct, f"Extracting... ({i}/{total})")
+    if progress_callback:
+        progress_callback(95, f"Extracting... ({total}/{total})")
 
     VERSION_FILE.write_text(CURRENT_VERSION)
-    _debug(f"[DEBUG] Wrote version file: {VERSION_FILE}")
+    _debug("[DEBUG] Wrote version file: %s", VERSION_FILE)
+
+    # Installation changed - drop anything resolved before extraction
+    is_ready.cache_clear()
+    get_tool_path.cache_clear()
 
-    exe = CALIBRE_DIR / "ebook-convert.exe"
-    _debug(f"[DEBUG] Verification - exe exists: {exe.exists()}")
+    if DEBUG:
+        exe = CALIBRE_DIR / "ebook-convert.exe"
+        _debug("[DEBUG] Verification - exe exists: %s", exe.exists())
 
     if progress_callback:
         progress_callback(100, "Setup complete!")
@@ -112,7 +204,7 @@ def extract_async(progress_callback=None, on_complete=None):
             if on_complete:
                 on_complete(True, None)
         except Exception as e:
-            _debug(f"[DEBUG] Extraction error: {e}")
+            _debug("[DEBUG] Extraction error: %s", e)
             if on_complete:
                 on_complete(False, e)
 
@@ -120,6 +212,7 @@ def extract_async(progress_callback=None, on_complete=None):
     thread.start()
 
 
+@functools.lru_cache(maxsize=16)
 def get_tool_path(name: str) -> Path:
     """Get path to a Calibre tool."""
     tool = CALIBRE_DIR / f"{name}.exe"
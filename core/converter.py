@@ -1,9 +1,11 @@
 """Ebook conversion using Calibre's ebook-convert."""
+import asyncio
+import os
 import subprocess
 import threading
 import tempfile
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 import re
 import sys
 import shutil
@@ -11,6 +13,19 @@ import shutil
 from core.calibre_setup import get_tool_path
 import config
 
+# Characters not allowed in filenames, and whitespace runs to collapse
+_FN_TRANSLATE = str.maketrans('', '', '<>:"/\\|?*')
+_WS_RE = re.compile(r'\s+')
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """Hardlink src to dst, copying only if the filesystem can't link."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class ConversionResult:
     """Result of a conversion operation."""
@@ -45,9 +60,16 @@ class ConversionResult:
 
 
 class Converter:
+    _PCT_RE = re.compile(rb'(\d+)%')
+    _ASIN_RE = re.compile(r'mobi-asin:([a-f0-9-]+)', re.IGNORECASE)
+
     def __init__(self):
         self.ebook_convert = self._find_tool("ebook-convert")
         self.ebook_meta = self._find_tool("ebook-meta")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        # Caps how many conversions run at once on the shared loop
+        self._slots: Optional[asyncio.Semaphore] = None
 
     def _find_tool(self, name: str) -> str:
         """Find a Calibre tool executable."""
@@ -62,69 +84,74 @@ class Converter:
             return subprocess.CREATE_NO_WINDOW
         return 0
 
-    def _extract_cover(self, input_path: Path, cover_path: Path) -> bool:
-        """Extract cover image from ebook."""
-        try:
-            cmd = [
-                self.ebook_meta,
-                str(input_path),
-                "--get-cover", str(cover_path)
-            ]
-
-            subprocess.run(
-                cmd,
-                capture_output=True,
-                creationflags=self._get_creation_flags(),
-                timeout=60
-            )
-
-            return cover_path.exists() and cover_path.stat().st_size > 0
+    def _extract_cover(self, input_path: Path, cover_path: Optional[Path]) -> Tuple[bool, Optional[str]]:
+        """Extract cover image from ebook.
 
-        except Exception as e:
-            print(f"Cover extraction failed: {e}")
-            return False
-
-    def _extract_mobi_asin(self, book_path: Path) -> Optional[str]:
-        """Extract mobi-asin from book using ebook-meta."""
+        ebook-meta prints the book's metadata on the same run, so the
+        mobi-asin is parsed from its output as well. With no cover_path
+        only the metadata is read.
+        """
         try:
-            cmd = [self.ebook_meta, str(book_path)]
+            cmd = [self.ebook_meta, str(input_path)]
+            if cover_path:
+                cmd.extend(["--get-cover", str(cover_path)])
+
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
+                errors="replace",
                 creationflags=self._get_creation_flags(),
-                timeout=30
+                timeout=60
             )
 
-            if result.returncode != 0:
-                return None
+            mobi_asin = None
+            if result.returncode == 0:
+                match = self._ASIN_RE.search(result.stdout)
+                if match:
+                    mobi_asin = match.group(1)
 
-            # Parse output for mobi-asin
-            match = re.search(r'mobi-asin:([a-f0-9-]+)', result.stdout, re.IGNORECASE)
-            if match:
-                return match.group(1)
+            has_cover = bool(cover_path) and cover_path.exists() and cover_path.stat().st_size > 0
+            return has_cover, mobi_asin
 
         except Exception as e:
-            print(f"Error extracting mobi-asin: {e}")
-
-        return None
+            print(f"Cover extraction failed: {e}")
+            return False, None
 
     def _clean_filename(self, name: str) -> str:
         """Clean filename to avoid path issues."""
-        clean = re.sub(r'[<>:"/\\|?*]', '', name)
-        clean = re.sub(r'\s+', ' ', clean).strip()
-        if len(clean) > 80:
-            clean = clean[:80]
-        return clean
+        return _WS_RE.sub(' ', name.translate(_FN_TRANSLATE)).strip()[:80]
 
     def convert(
         self,
         input_path: Path,
         output_format: str,
         output_dir: Optional[Path] = None,
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        verify_cover: bool = True
     ) -> ConversionResult:
-        """Convert ebook to specified format with cover preservation."""
+        """Convert ebook to specified format with cover preservation.
+
+        When the source has no cover, verify_cover falls back to the cover
+        calibre put in the output; pass False to skip that.
+        """
+        return asyncio.run(self.convert_async_io(
+            input_path, output_format, output_dir, progress_callback, verify_cover
+        ))
+
+    async def convert_async_io(
+        self,
+        input_path: Path,
+        output_format: str,
+        output_dir: Optional[Path] = None,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        verify_cover: bool = True
+    ) -> ConversionResult:
+        """Coroutine version of convert().
+
+        ebook-convert's output is streamed through the event loop, so many
+        conversions can share one thread while they wait on calibre.
+        """
         if output_dir is None:
             output_dir = config.TEMP_DIR
 
@@ -137,10 +164,10 @@ class Converter:
         # Cover save path
         cover_save_path = output_dir / f"{clean_name}_cover.jpg"
 
-        if output_path.exists():
-            output_path.unlink()
+        output_path.unlink(missing_ok=True)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Same filesystem as the output, so covers can be linked out instead of copied
+        with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
             temp_dir = Path(temp_dir)
             cover_path = temp_dir / "cover.jpg"
 
@@ -148,14 +175,16 @@ class Converter:
             if progress_callback:
                 progress_callback(5, "Extracting cover...")
 
-            has_cover = self._extract_cover(input_path, cover_path)
+            has_cover, _ = await asyncio.to_thread(self._extract_cover, input_path, cover_path)
             if has_cover:
                 print(f"Extracted cover: {cover_path.stat().st_size} bytes")
-                shutil.copy2(cover_path, cover_save_path)
+                _link_or_copy(cover_path, cover_save_path)
             else:
                 print("No cover found in source file")
                 cover_save_path = None
 
+            has_extracted_cover = has_cover and cover_save_path is not None
+
             # Step 2: Convert
             cmd = [
                 self.ebook_convert,
@@ -172,24 +201,25 @@ class Converter:
 
             print(f"Converting: {input_path.name} -> {output_path.name}")
 
-            process = subprocess.Popen(
-                cmd,
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                limit=1 << 20,
                 creationflags=self._get_creation_flags()
             )
 
-            for line in iter(process.stdout.readline, ''):
-                if progress_callback:
-                    match = re.search(r'(\d+)%', line)
-                    if match:
-                        raw_pct = int(match.group(1))
-                        current_progress = 10 + int(raw_pct * 0.70)
-                        progress_callback(current_progress, line.strip()[:50])
+            # Raw bytes; only lines that can carry a percentage get decoded
+            async for line in process.stdout:
+                if not progress_callback or b'%' not in line:
+                    continue
+                match = Converter._PCT_RE.search(line)
+                if match:
+                    raw_pct = int(match.group(1))
+                    current_progress = 10 + int(raw_pct * 0.70)
+                    progress_callback(current_progress, line.decode('utf-8', 'replace').strip()[:50])
 
-            process.wait()
+            await process.wait()
 
             if process.returncode != 0:
                 raise RuntimeError(f"Conversion failed with code {process.returncode}")
@@ -197,26 +227,27 @@ class Converter:
             if not output_path.exists():
                 raise RuntimeError("Output file not found after conversion")
 
-            # Step 3: Extract mobi-asin that calibre assigned
+            # Step 3: Read the mobi-asin calibre assigned. When the source had
+            # no cover, the same ebook-meta run pulls the output's cover.
             if progress_callback:
                 progress_callback(85, "Reading metadata...")
 
-            mobi_asin = self._extract_mobi_asin(output_path)
+            want_output_cover = verify_cover and not has_extracted_cover
+            verify_path = temp_dir / "verify_cover.jpg" if want_output_cover else None
+            has_output_cover, mobi_asin = await asyncio.to_thread(self._extract_cover, output_path, verify_path)
             if mobi_asin:
                 print(f"Found mobi-asin: {mobi_asin}")
             else:
                 print("Warning: No mobi-asin found in converted file")
 
             # Step 4: Verify cover in output
-            if progress_callback:
-                progress_callback(90, "Verifying cover...")
+            if want_output_cover:
+                if progress_callback:
+                    progress_callback(90, "Verifying cover...")
 
-            if not cover_save_path or not cover_save_path.exists():
-                # Try extracting from converted file
-                verify_cover = temp_dir / "verify_cover.jpg"
-                if self._extract_cover(output_path, verify_cover):
-                    shutil.copy2(verify_cover, output_dir / f"{clean_name}_cover.jpg")
+                if has_output_cover:
                     cover_save_path = output_dir / f"{clean_name}_cover.jpg"
+                    _link_or_copy(verify_path, cover_save_path)
                     print(f"Extracted cover from output: {cover_save_path.stat().st_size} bytes")
 
         if progress_callback:
@@ -230,21 +261,46 @@ class Converter:
         output_format: str,
         output_dir: Optional[Path] = None,
         progress_callback: Optional[Callable[[float, str], None]] = None,
-        completion_callback: Optional[Callable[[Optional[ConversionResult], Optional[Exception]], None]] = None
+        completion_callback: Optional[Callable[[Optional[ConversionResult], Optional[Exception]], None]] = None,
+        verify_cover: bool = True
     ):
-        """Run conversion in background thread."""
-        def worker():
+        """Run conversion in the background.
+
+        All conversions are multiplexed on one private event-loop thread,
+        at most config.MAX_CONCURRENT_CONVERSIONS of them at a time.
+        Returns a concurrent.futures.Future for the result.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._convert_bounded(input_path, output_format, output_dir, progress_callback, verify_cover),
+            self._get_loop()
+        )
+
+        def done(fut):
             try:
-                result = self.convert(input_path, output_format, output_dir, progress_callback)
-                if completion_callback:
-                    completion_callback(result, None)
+                result = fut.result()
             except Exception as e:
                 print(f"Conversion error: {e}")
                 import traceback
-                traceback.print_exc()
+                traceback.print_exception(type(e), e, e.__traceback__)
                 if completion_callback:
                     completion_callback(None, e)
+            else:
+                if completion_callback:
+                    completion_callback(result, None)
 
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-        return thread
\ No newline at end of file
+        future.add_done_callback(done)
+        return future
+
+    async def _convert_bounded(self, *args) -> ConversionResult:
+        """convert_async_io() once one of the MAX_CONCURRENT_CONVERSIONS slots is free."""
+        async with self._slots:
+            return await self.convert_async_io(*args)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop background conversions run on, starting it if needed."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._slots = asyncio.Semaphore(config.MAX_CONCURRENT_CONVERSIONS)
+                threading.Thread(target=self._loop.run_forever, daemon=True).start()
+            return self._loop
@@ -1,12 +1,64 @@
 """Kindle device detection and file transfer."""
+import errno
 import os
 import shutil
 import threading
+import time
 from pathlib import Path
 from typing import Optional, Callable, List
 import string
 import platform
 
+# GetDriveTypeW return values
+DRIVE_REMOVABLE = 2
+DRIVE_FIXED = 3
+
+# Window messages used by the Windows device watcher
+WM_DESTROY = 0x0002
+WM_CLOSE = 0x0010
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+# Book formats listed from the device's documents folder
+BOOK_EXTENSIONS = frozenset({'.azw3', '.mobi', '.azw', '.pdf', '.txt', '.epub'})
+
+# Per-thread copy buffer so concurrent transfers don't share one
+_buffers = threading.local()
+
+
+def _copy_buffer() -> bytearray:
+    """Get this thread's reusable 1 MiB copy buffer."""
+    buf = getattr(_buffers, "buf", None)
+    if buf is None:
+        buf = _buffers.buf = bytearray(1024 * 1024)
+    return buf
+
+
+def _preallocate(f, size: int):
+    """Reserve the full length of a file before writing it.
+
+    Lets the Kindle's FAT filesystem allocate one extent up front instead
+    of growing the cluster chain on every write. Best effort only.
+    """
+    if size <= 0:
+        return
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, size)
+        elif platform.system() == "Windows":
+            import ctypes
+            import msvcrt
+            from ctypes import wintypes
+
+            kernel32 = ctypes.windll.kernel32
+            handle = wintypes.HANDLE(msvcrt.get_osfhandle(f.fileno()))
+            if kernel32.SetFilePointerEx(handle, ctypes.c_longlong(size), None, 0):
+                kernel32.SetEndOfFile(handle)
+            kernel32.SetFilePointerEx(handle, ctypes.c_longlong(0), None, 0)
+    except OSError:
+        pass
+
 
 class KindleDevice:
     def __init__(self, path: Path, name: str = "Kindle"):
@@ -14,36 +66,42 @@ class KindleDevice:
         self.name = name
         self.documents_folder = path / "documents"
         self.thumbnail_folder = path / "system" / "thumbnails"
+        self._fs_cache: Optional[tuple] = None
 
     @property
     def free_space(self) -> str:
-        """Get free space on device."""
+        """Get free space on device (cached for a second across UI redraws)."""
+        now = time.monotonic()
+        if self._fs_cache and now - self._fs_cache[0] < 1.0:
+            return self._fs_cache[1]
+
         try:
-            if platform.system() == "Windows":
-                import ctypes
-                free_bytes = ctypes.c_ulonglong(0)
-                ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                    ctypes.c_wchar_p(str(self.path)), None, None, ctypes.pointer(free_bytes)
-                )
-                free = free_bytes.value
-            else:
-                stat = os.statvfs(self.path)
-                free = stat.f_bavail * stat.f_frsize
+            free = shutil.disk_usage(self.path).free
 
             for unit in ["B", "KB", "MB", "GB"]:
                 if free < 1024:
-                    return f"{free:.1f} {unit}"
+                    value = f"{free:.1f} {unit}"
+                    break
                 free /= 1024
-            return f"{free:.1f} TB"
+            else:
+                value = f"{free:.1f} TB"
         except:
-            return "Unknown"
+            value = "Unknown"
+
+        self._fs_cache = (now, value)
+        return value
 
     def get_books(self) -> List[Path]:
         """List books currently on device."""
-        if not self.documents_folder.exists():
+        try:
+            with os.scandir(self.documents_folder) as it:
+                return [
+                    Path(e.path) for e in it
+                    if e.is_file(follow_symlinks=False)
+                    and os.path.splitext(e.name)[1].lower() in BOOK_EXTENSIONS
+                ]
+        except OSError:
             return []
-        extensions = {'.azw3', '.mobi', '.azw', '.pdf', '.txt', '.epub'}
-        return [f for f in self.documents_folder.iterdir() if f.suffix.lower() in extensions]
 
 
 class KindleManager:
@@ -51,6 +109,7 @@ class KindleManager:
         self._device: Optional[KindleDevice] = None
         self._monitor_thread: Optional[threading.Thread] = None
         self._monitoring = False
+        self._stop_watch: Optional[Callable[[], None]] = None
         self._callbacks: List[Callable[[Optional[KindleDevice]], None]] = []
 
     @property
@@ -93,11 +152,22 @@ class KindleManager:
 
     def _scan_windows(self) -> Optional[KindleDevice]:
         """Scan for Kindle on Windows."""
-        for letter in string.ascii_uppercase:
-            drive = Path(f"{letter}:\\")
-            if not drive.exists():
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+
+        # One bitmask call instead of probing all 26 letters
+        drive_mask = kernel32.GetLogicalDrives()
+
+        for i, letter in enumerate(string.ascii_uppercase):
+            if not drive_mask & (1 << i):
                 continue
 
+            # Only removable/fixed - don't spin up optical or network drives
+            root = f"{letter}:\\"
+            if kernel32.GetDriveTypeW(ctypes.c_wchar_p(root)) not in (DRIVE_REMOVABLE, DRIVE_FIXED):
+                continue
+
+            drive = Path(root)
             docs = drive / "documents"
 
             if docs.exists():
@@ -114,15 +184,15 @@ class KindleManager:
 
     def _scan_macos(self) -> Optional[KindleDevice]:
         """Scan for Kindle on macOS."""
-        volumes = Path("/Volumes")
-        if not volumes.exists():
-            return None
-
-        for vol in volumes.iterdir():
-            if "kindle" in vol.name.lower():
-                docs = vol / "documents"
-                if docs.exists():
-                    return KindleDevice(vol, vol.name)
+        try:
+            with os.scandir("/Volumes") as it:
+                for entry in it:
+                    if "kindle" in entry.name.lower():
+                        vol = Path(entry.path)
+                        if (vol / "documents").exists():
+                            return KindleDevice(vol, entry.name)
+        except OSError:
+            pass
 
         return None
 
@@ -140,14 +210,17 @@ class KindleManager:
         ]
 
         for mount in mount_points:
-            if not mount.exists():
+            try:
+                with os.scandir(mount) as it:
+                    entries = [e for e in it if e.is_dir()]
+            except OSError:
                 continue
-            for device in mount.iterdir():
-                if device.is_dir():
-                    docs = device / "documents"
-                    if docs.exists():
-                        if (device / "system").exists() or (device / "amazon-cover-bug").exists():
-                            return KindleDevice(device, device.name)
+            for entry in entries:
+                device = Path(entry.path)
+                docs = device / "documents"
+                if docs.exists():
+                    if (device / "system").exists() or (device / "amazon-cover-bug").exists():
+                        return KindleDevice(device, entry.name)
 
         return None
 
@@ -163,18 +236,31 @@ class KindleManager:
             pass
         return "Kindle"
 
-    def start_monitoring(self, interval: float = 2.0):
-        """Start background monitoring for device connection."""
+    def start_monitoring(self, interval: float = 2.0, use_notifications: bool = True):
+        """Start background monitoring for device connection.
+
+        With use_notifications the thread sleeps on OS device/mount events
+        and only rescans when something changes. Otherwise, or when no
+        notification source is available, it polls every `interval` seconds.
+        """
         if self._monitoring:
             return
 
         self._monitoring = True
 
         def monitor():
-            import time
+            self.scan()
+
+            if use_notifications:
+                try:
+                    if self._watch_devices():
+                        return
+                except Exception as e:
+                    print(f"Device notifications unavailable, polling instead: {e}")
+
             while self._monitoring:
-                self.scan()
                 time.sleep(interval)
+                self.scan()
 
         self._monitor_thread = threading.Thread(target=monitor, daemon=True)
         self._monitor_thread.start()
@@ -182,6 +268,140 @@ class KindleManager:
     def stop_monitoring(self):
         """Stop background monitoring."""
         self._monitoring = False
+        if self._stop_watch:
+            self._stop_watch()
+            self._stop_watch = None
+
+    def _watch_devices(self) -> bool:
+        """Block on platform device notifications until monitoring stops."""
+        system = platform.system()
+
+        if system == "Windows":
+            self._watch_windows()
+        elif system == "Darwin":
+            self._watch_macos()
+        elif system == "Linux":
+            self._watch_linux()
+        else:
+            return False
+        return True
+
+    def _watch_windows(self):
+        """Rescan on WM_DEVICECHANGE volume arrival/removal.
+
+        Volume changes are broadcast to every top-level window, so a hidden
+        one is enough (message-only windows don't get broadcasts).
+        """
+        import ctypes
+        from ctypes import wintypes
+
+        # Private DLL handles so the argtypes below don't leak to other users
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [
+                ("style", wintypes.UINT),
+                ("lpfnWndProc", WNDPROC),
+                ("cbClsExtra", ctypes.c_int),
+                ("cbWndExtra", ctypes.c_int),
+                ("hInstance", wintypes.HINSTANCE),
+                ("hIcon", wintypes.HICON),
+                ("hCursor", wintypes.HANDLE),
+                ("hbrBackground", wintypes.HBRUSH),
+                ("lpszMenuName", wintypes.LPCWSTR),
+                ("lpszClassName", wintypes.LPCWSTR),
+            ]
+
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = LRESULT
+        user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID
+        ]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.UnregisterClassW.argtypes = [wintypes.LPCWSTR, wintypes.HINSTANCE]
+        user32.PostMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == WM_DEVICECHANGE and wparam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE):
+                self.scan()
+            elif msg == WM_DESTROY:
+                user32.PostQuitMessage(0)
+                return 0
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        hinstance = kernel32.GetModuleHandleW(None)
+        wc = WNDCLASSW()
+        # wc holds the only reference to this thunk, and the class is
+        # unregistered below before wc goes away, so Windows never calls a
+        # freed thunk. The per-instance name keeps two managers apart.
+        wc.lpfnWndProc = WNDPROC(wnd_proc)
+        wc.hInstance = hinstance
+        wc.lpszClassName = f"KindleSenderDeviceWatcher{id(self):x}"
+
+        if not user32.RegisterClassW(ctypes.byref(wc)):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        try:
+            hwnd = user32.CreateWindowExW(0, wc.lpszClassName, "", 0, 0, 0, 0, 0, None, None, hinstance, None)
+            if not hwnd:
+                raise ctypes.WinError(ctypes.get_last_error())
+
+            self._stop_watch = lambda: user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+            if not self._monitoring:
+                self._stop_watch()
+
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            user32.UnregisterClassW(wc.lpszClassName, hinstance)
+
+    def _watch_macos(self):
+        """Rescan when a volume appears in or leaves /Volumes."""
+        import select
+
+        fd = os.open("/Volumes", os.O_RDONLY)
+        kq = select.kqueue()
+        try:
+            kq.control([select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE
+            )], 0)
+
+            while self._monitoring:
+                if kq.control(None, 1, 1.0):
+                    # The mount point shows up just before the volume is mounted
+                    time.sleep(1.0)
+                    self.scan()
+        finally:
+            kq.close()
+            os.close(fd)
+
+    def _watch_linux(self):
+        """Rescan whenever the mount table changes."""
+        import select
+
+        with open("/proc/self/mounts") as mounts:
+            poller = select.poll()
+            poller.register(mounts, select.POLLPRI | select.POLLERR)
+
+            while self._monitoring:
+                if poller.poll(1000):
+                    # Reading re-arms the notification
+                    mounts.seek(0)
+                    mounts.read()
+                    self.scan()
 
     def _create_thumbnail(self, cover_path: Path, thumbnail_path: Path) -> bool:
         """Create a properly sized thumbnail for Kindle."""
@@ -194,22 +414,22 @@ class KindleManager:
 
             img = Image.open(cover_path)
 
-            # Convert to RGB
-            if img.mode in ('RGBA', 'P'):
+            # Palette images would be resized with NEAREST
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+
+            # Resize maintaining aspect ratio. Done before any conversion so
+            # JPEGs decode at reduced scale (draft) instead of full size.
+            img.thumbnail((THUMB_WIDTH, THUMB_HEIGHT), Image.Resampling.LANCZOS)
+
+            # Convert to RGB (only the small image gets composited)
+            if img.mode == 'RGBA':
                 background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                if img.mode == 'RGBA':
-                    background.paste(img, mask=img.split()[-1])
-                else:
-                    background.paste(img)
+                background.paste(img, mask=img.split()[-1])
                 img = background
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
 
-            # Resize maintaining aspect ratio
-            img.thumbnail((THUMB_WIDTH, THUMB_HEIGHT), Image.Resampling.LANCZOS)
-
             # Save as JPEG
             img.save(thumbnail_path, 'JPEG', quality=90)
             return True
@@ -218,6 +438,66 @@ class KindleManager:
             print(f"Failed to create thumbnail: {e}")
             return False
 
+    def _copy_with_progress(
+        self,
+        src_path: Path,
+        dst_path: Path,
+        file_size: int,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ):
+        """Copy a file, reporting progress over the 0-80% range."""
+        copied = 0
+        last = time.monotonic()
+
+        def report():
+            nonlocal last
+            now = time.monotonic()
+            if progress_callback and file_size and now - last > 0.05:
+                progress_callback((copied / file_size) * 80)
+                last = now
+
+        with open(src_path, 'rb') as src, open(dst_path, 'wb', buffering=1 << 20) as dst:
+            _preallocate(dst, file_size)
+            done = False
+
+            # In-kernel copy on Linux; macOS sendfile only writes to sockets
+            if platform.system() == "Linux":
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                try:
+                    while True:
+                        sent = os.sendfile(dst_fd, src_fd, copied, 8 << 20)
+                        if sent == 0:
+                            break
+                        copied += sent
+                        report()
+                    done = True
+                except OSError as e:
+                    # Some FUSE/SMB mounts don't support it - fall back below
+                    if copied or e.errno not in (errno.ENOSYS, errno.EINVAL, errno.ENOTSUP):
+                        raise
+
+            if not done:
+                buf = _copy_buffer()
+                view = memoryview(buf)
+                while True:
+                    n = src.readinto(buf)
+                    if not n:
+                        break
+                    dst.write(view[:n])
+                    copied += n
+                    report()
+
+            # Source changed size mid-copy - drop the unused reservation
+            if copied != file_size:
+                os.ftruncate(dst.fileno(), copied)
+
+            # Sync once at the end so "done" means the data is on the device
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        if progress_callback:
+            progress_callback(80)
+
     def transfer_file(
         self,
         file_path,
@@ -249,19 +529,9 @@ class KindleManager:
         print(f"Transferring: {actual_path.name}")
 
         file_size = actual_path.stat().st_size
-        copied = 0
-        chunk_size = 1024 * 1024
 
         # Copy the book file
-        with open(actual_path, 'rb') as src, open(dest, 'wb') as dst:
-            while True:
-                chunk = src.read(chunk_size)
-                if not chunk:
-                    break
-                dst.write(chunk)
-                copied += len(chunk)
-                if progress_callback:
-                    progress_callback((copied / file_size) * 80)
+        self._copy_with_progress(actual_path, dest, file_size, progress_callback)
 
         print(f"Book transferred to: {dest}")
 
@@ -1,22 +1,129 @@
 """Extract metadata and covers from ebook files."""
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import zipfile
 from dataclasses import dataclass
 from PIL import Image
+import functools
+import hashlib
 import io
+import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
 
+import config
 from core.calibre_setup import get_tool_path
 
+try:
+    from lxml import etree as _etree
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as _etree
+    _HAVE_LXML = False
+
+# ebook-meta output
+_AUTHOR_BRACKETS_RE = re.compile(r'\s*\[[^\]]+\]')
+
+# EPUB container/OPF (matched on raw bytes)
+_OPF_FULL_PATH_RE = re.compile(rb'full-path="([^"]+\.opf)"')
+_OPF_DCTITLE_RE = re.compile(rb'<dc:title[^>]*>([^<]+)</dc:title>', re.IGNORECASE)
+_OPF_TITLE_RE = re.compile(rb'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_OPF_DCCREATOR_RE = re.compile(rb'<dc:creator[^>]*>([^<]+)</dc:creator>', re.IGNORECASE)
+_OPF_CREATOR_RE = re.compile(rb'<creator[^>]*>([^<]+)</creator>', re.IGNORECASE)
+_OPF_COVER_META1_RE = re.compile(rb'<meta[^>]*name="cover"[^>]*content="([^"]+)"', re.IGNORECASE)
+_OPF_COVER_META2_RE = re.compile(rb'<meta[^>]*content="([^"]+)"[^>]*name="cover"', re.IGNORECASE)
+_OPF_COVER_ITEM1_RE = re.compile(
+    rb'<item[^>]*(?:id="[^"]*cover[^"]*"|properties="[^"]*cover[^"]*")[^>]*href="([^"]+)"', re.IGNORECASE
+)
+_OPF_COVER_ITEM2_RE = re.compile(
+    rb'<item[^>]*href="([^"]+)"[^>]*(?:id="[^"]*cover[^"]*"|properties="[^"]*cover[^"]*")', re.IGNORECASE
+)
+_DC_NS = '{http://purl.org/dc/elements/1.1/}'
+_COVER_NAMES = ('cover.jpg', 'cover.jpeg', 'cover.png')
+
+# Covers are only ever shown as thumbnails; they are kept at most this size
+_COVER_SIZE = (400, 600)
+
+
+@functools.lru_cache(maxsize=1)
+def _turbojpeg():
+    """Optional libjpeg-turbo decoder (PyTurboJPEG); None if unavailable."""
+    try:
+        from turbojpeg import TurboJPEG
+        return TurboJPEG()
+    except Exception:
+        return None
+
+
+def _open_cover(data: bytes) -> Image.Image:
+    """Decode cover bytes, letting libjpeg-turbo DCT-scale large JPEGs."""
+    jpeg = _turbojpeg() if data[:3] == b'\xff\xd8\xff' else None
+    if jpeg is not None:
+        try:
+            from turbojpeg import TJPF_RGB, TJFLAG_FASTDCT, TJFLAG_FASTUPSAMPLE
+
+            width, height = jpeg.decode_header(data)[:2]
+            min_w, min_h = _COVER_SIZE
+            scale = (1, 1)
+            for num, den in jpeg.scaling_factors:
+                if (num * scale[1] < scale[0] * den
+                        and -(-width * num // den) >= min_w and -(-height * num // den) >= min_h):
+                    scale = (num, den)
+            pixels = jpeg.decode(
+                data,
+                pixel_format=TJPF_RGB,
+                scaling_factor=scale,
+                flags=TJFLAG_FASTDCT | TJFLAG_FASTUPSAMPLE
+            )
+            return Image.fromarray(pixels)
+        except Exception:
+            pass
+    return Image.open(io.BytesIO(data))
+
+
+def _cover_bytes(data: bytes) -> bytes:
+    """Shrink a cover to thumbnail size and return it as JPEG bytes."""
+    img = _open_cover(data)
+    if img.format == 'JPEG':
+        if img.width <= _COVER_SIZE[0] and img.height <= _COVER_SIZE[1]:
+            return data
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale instead of full size
+        img.draft('RGB', _COVER_SIZE)
+
+    img.thumbnail(_COVER_SIZE, Image.Resampling.BILINEAR)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        img = img.convert('RGBA')
+        flat = Image.new('RGB', img.size, (255, 255, 255))
+        flat.paste(img, mask=img.getchannel('A'))
+        img = flat
+    elif img.mode not in ('RGB', 'L'):
+        img = img.convert('RGB')
+
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG', quality=80)
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=64)
+def _decode_cover(data: bytes) -> Image.Image:
+    """Decode stored cover bytes; results are shared, so treat them as read-only."""
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    return img
+
 
 @dataclass
 class BookMetadata:
     title: str
     author: str
-    cover_image: Optional[Image.Image]
+    cover_image_bytes: Optional[bytes]
     file_path: Path
     file_size: str
     format: str
@@ -25,6 +132,13 @@ class BookMetadata:
     def display_title(self) -> str:
         return self.title[:50] + "..." if len(self.title) > 50 else self.title
 
+    @property
+    def cover_image(self) -> Optional[Image.Image]:
+        """Cover decoded on demand from cover_image_bytes."""
+        if not self.cover_image_bytes:
+            return None
+        return _decode_cover(self.cover_image_bytes)
+
 
 def get_file_size_str(path: Path) -> str:
     """Human-readable file size."""
@@ -36,138 +150,278 @@ def get_file_size_str(path: Path) -> str:
     return f"{size:.1f} TB"
 
 
-def fetch_metadata_calibre(file_path: Path) -> Optional[dict]:
-    """Use Calibre's ebook-meta to get metadata."""
+def _ebook_meta_tool() -> Optional[Path]:
+    """Resolved ebook-meta path, or None if Calibre isn't available.
+
+    Hits are memoized by get_tool_path, which calibre_setup clears after extraction.
+    """
     try:
-        ebook_meta_tool = get_tool_path("ebook-meta")
+        return get_tool_path("ebook-meta")
     except FileNotFoundError:
         return None
 
+
+def fetch_metadata_calibre(file_path: Path, tmp_dir: Optional[Path] = None,
+                           get_cover: bool = True) -> Optional[dict]:
+    """Use Calibre's ebook-meta to get metadata (and cover) in one call."""
+    ebook_meta_tool = _ebook_meta_tool()
+    if ebook_meta_tool is None:
+        return None
+
     result = {}
+    cmd = [str(ebook_meta_tool), str(file_path)]
+    cover_path = None
+    if get_cover:
+        # Unique name, so single calls can share the app temp dir without a
+        # TemporaryDirectory each; batches pass their own shared dir
+        cover_path = Path(tmp_dir or config.TEMP_DIR) / f"cover_{uuid.uuid4().hex}.jpg"
+        cmd += ["--get-cover", str(cover_path)]
 
     try:
         creationflags = 0
         if sys.platform == 'win32':
             creationflags = subprocess.CREATE_NO_WINDOW
 
-        proc = subprocess.run(
-            [str(ebook_meta_tool), str(file_path)],
-            capture_output=True,
+        # ebook-meta prints the metadata and writes the cover in a single run
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            creationflags=creationflags,
-            timeout=30
+            errors='replace',
+            bufsize=1,
+            creationflags=creationflags
         )
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(30, kill_on_timeout)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                key, sep, value = line.partition(':')
+                if not sep:
+                    continue
+                key = key.strip()
+                if key == 'Title' and 'title' not in result:
+                    result['title'] = value.strip()
+                elif key == 'Author(s)' and 'author' not in result:
+                    result['author'] = _AUTHOR_BRACKETS_RE.sub('', value.strip())
+
+                # The cover is written after the metadata is printed, so only
+                # stop early when it wasn't requested
+                if not get_cover and 'title' in result and 'author' in result:
+                    proc.kill()
+                    break
+            proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
 
-        if proc.returncode == 0:
-            output = proc.stdout
-
-            # Parse title
-            title_match = re.search(r'^Title\s*:\s*(.+)$', output, re.MULTILINE)
-            if title_match:
-                result['title'] = title_match.group(1).strip()
-
-            # Parse author
-            author_match = re.search(r'^Author\(s\)\s*:\s*(.+)$', output, re.MULTILINE)
-            if author_match:
-                author = author_match.group(1).strip()
-                author = re.sub(r'\s*\[[^\]]+\]', '', author)
-                result['author'] = author
-
-        # Extract cover using ebook-meta --get-cover
-        import tempfile
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cover_path = Path(temp_dir) / "cover.jpg"
-
-            proc = subprocess.run(
-                [str(ebook_meta_tool), str(file_path), "--get-cover", str(cover_path)],
-                capture_output=True,
-                text=True,
-                creationflags=creationflags,
-                timeout=30
-            )
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 30)
 
-            if cover_path.exists():
-                result['cover_image'] = Image.open(cover_path).copy()
+        if cover_path and cover_path.exists():
+            result['cover_image_bytes'] = _cover_bytes(cover_path.read_bytes())
 
     except subprocess.TimeoutExpired:
         print("Metadata extraction timed out")
     except Exception as e:
         print(f"Error fetching metadata with Calibre: {e}")
+    finally:
+        if cover_path:
+            cover_path.unlink(missing_ok=True)
 
     return result if result else None
 
 
+def fetch_metadata_calibre_batch(paths: List[Path],
+                                 get_cover: Optional[List[bool]] = None) -> List[Optional[dict]]:
+    """Run ebook-meta for many files concurrently, sharing one temp dir."""
+    if not paths:
+        return []
+    if _ebook_meta_tool() is None:
+        return [None] * len(paths)
+    if get_cover is None:
+        get_cover = [True] * len(paths)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+            return list(pool.map(
+                lambda p, c: fetch_metadata_calibre(p, Path(temp_dir), c), paths, get_cover
+            ))
+
+
+def _local_name(tag) -> str:
+    """Strip the namespace from an element tag."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+_parser_local = threading.local()
+
+
+def _opf_parser():
+    """lxml parser that never expands entities or fetches anything (the OPF is
+    untrusted input); one per thread since lxml parsers aren't shareable.
+    None means the stdlib parser, which doesn't resolve external entities."""
+    if not _HAVE_LXML:
+        return None
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+        _parser_local.parser = parser
+    return parser
+
+
+def _parse_opf_xml(opf_bytes: bytes) -> Optional[tuple]:
+    """Parse OPF title/author/cover href in one XML pass; None if malformed."""
+    try:
+        root = _etree.fromstring(opf_bytes, _opf_parser())
+    except Exception:
+        return None
+
+    titles = {}
+    authors = {}
+    cover_id = None
+    items = []
+    for elem in root.iter():
+        tag = elem.tag
+        name = _local_name(tag)
+        if name == 'title' or name == 'creator':
+            text = (elem.text or '').strip()
+            if text and len(elem) == 0:
+                bucket = titles if name == 'title' else authors
+                bucket.setdefault(tag.startswith(_DC_NS), text)
+        elif name == 'meta':
+            if cover_id is None and elem.get('name', '').lower() == 'cover':
+                cover_id = elem.get('content')
+        elif name == 'item':
+            items.append(elem)
+
+    title = titles.get(True) or titles.get(False)
+    author = authors.get(True) or authors.get(False)
+
+    cover_href = None
+    if cover_id:
+        for item in items:
+            if item.get('id') == cover_id and item.get('href'):
+                cover_href = item.get('href')
+                break
+    if not cover_href:
+        for item in items:
+            if item.get('href') and (
+                'cover' in item.get('id', '').lower() or 'cover' in item.get('properties', '').lower()
+            ):
+                cover_href = item.get('href')
+                break
+
+    return title, author, cover_href
+
+
+def _decode_group(match) -> str:
+    """Decode the first captured group of a bytes regex match."""
+    return match.group(1).decode('utf-8', errors='ignore')
+
+
+@functools.lru_cache(maxsize=256)
+def _item_by_id_patterns(cover_id: bytes):
+    """Compiled manifest <item> patterns for a cover id (either attribute order)."""
+    esc = re.escape(cover_id)
+    return (
+        re.compile(rb'<item[^>]*id="' + esc + rb'"[^>]*href="([^"]+)"', re.IGNORECASE),
+        re.compile(rb'<item[^>]*href="([^"]+)"[^>]*id="' + esc + rb'"', re.IGNORECASE),
+    )
+
+
+def _parse_opf_regex(opf_content: bytes) -> tuple:
+    """Regex fallback for OPF files the XML parser rejects."""
+    title = author = cover_href = None
+
+    title_match = _OPF_DCTITLE_RE.search(opf_content)
+    if not title_match:
+        title_match = _OPF_TITLE_RE.search(opf_content)
+    if title_match:
+        title = _decode_group(title_match).strip()
+
+    author_match = _OPF_DCCREATOR_RE.search(opf_content)
+    if not author_match:
+        author_match = _OPF_CREATOR_RE.search(opf_content)
+    if author_match:
+        author = _decode_group(author_match).strip()
+
+    cover_id_match = _OPF_COVER_META1_RE.search(opf_content)
+    if not cover_id_match:
+        cover_id_match = _OPF_COVER_META2_RE.search(opf_content)
+
+    if cover_id_match:
+        id_first, href_first = _item_by_id_patterns(cover_id_match.group(1))
+        item_match = id_first.search(opf_content) or href_first.search(opf_content)
+        if item_match:
+            cover_href = _decode_group(item_match)
+
+    if not cover_href:
+        cover_item_match = _OPF_COVER_ITEM1_RE.search(opf_content)
+        if not cover_item_match:
+            cover_item_match = _OPF_COVER_ITEM2_RE.search(opf_content)
+        if cover_item_match:
+            cover_href = _decode_group(cover_item_match)
+
+    return title, author, cover_href
+
+
+def _cover_href_candidates(zf: zipfile.ZipFile, lower_map: dict, full_path: str, href: str):
+    """Yield the exact cover entry, then case-insensitive suffix matches.
+
+    Lazy, so the name scan only happens if the exact entry is missing or unreadable.
+    """
+    if full_path in zf.NameToInfo:
+        yield full_path
+    href_lower = unquote(href).lower()
+    for key, name in lower_map.items():
+        if key.endswith(href_lower) and name != full_path:
+            yield name
+
+
 def extract_epub_metadata_fallback(epub_path: Path) -> dict:
-    """Fallback: Extract metadata directly from EPUB using regex."""
+    """Fallback: Extract metadata directly from the EPUB's OPF."""
     title = epub_path.stem
     author = "Unknown Author"
-    cover_image = None
+    cover_bytes = None
 
     try:
         with zipfile.ZipFile(epub_path, 'r') as zf:
+            names = zf.namelist()
+            lower_map = {n.lower(): n for n in names}
             opf_path = None
-            opf_content = None
+            opf_bytes = None
 
-            for name in zf.namelist():
-                if name.endswith('.opf'):
-                    opf_path = name
-                    opf_content = zf.read(name).decode('utf-8', errors='ignore')
-                    break
+            opf_matches = [n for n in names if n.endswith('.opf')]
+            if opf_matches:
+                opf_path = opf_matches[0]
+                opf_bytes = zf.read(opf_path)
 
             if not opf_path:
                 try:
-                    container = zf.read('META-INF/container.xml').decode('utf-8', errors='ignore')
-                    match = re.search(r'full-path="([^"]+\.opf)"', container)
+                    container = zf.read('META-INF/container.xml')
+                    match = _OPF_FULL_PATH_RE.search(container)
                     if match:
-                        opf_path = match.group(1)
-                        opf_content = zf.read(opf_path).decode('utf-8', errors='ignore')
+                        opf_path = _decode_group(match)
+                        opf_bytes = zf.read(opf_path)
                 except:
                     pass
 
-            if opf_content:
-                # Extract title
-                title_match = re.search(r'<dc:title[^>]*>([^<]+)</dc:title>', opf_content, re.IGNORECASE)
-                if not title_match:
-                    title_match = re.search(r'<title[^>]*>([^<]+)</title>', opf_content, re.IGNORECASE)
-                if title_match:
-                    title = title_match.group(1).strip()
-
-                # Extract author
-                author_match = re.search(r'<dc:creator[^>]*>([^<]+)</dc:creator>', opf_content, re.IGNORECASE)
-                if not author_match:
-                    author_match = re.search(r'<creator[^>]*>([^<]+)</creator>', opf_content, re.IGNORECASE)
-                if author_match:
-                    author = author_match.group(1).strip()
-
-                # Find cover image
-                cover_href = None
-
-                cover_id_match = re.search(r'<meta[^>]*name="cover"[^>]*content="([^"]+)"', opf_content, re.IGNORECASE)
-                if not cover_id_match:
-                    cover_id_match = re.search(r'<meta[^>]*content="([^"]+)"[^>]*name="cover"', opf_content, re.IGNORECASE)
-
-                if cover_id_match:
-                    cover_id = cover_id_match.group(1)
-                    item_pattern = rf'<item[^>]*id="{re.escape(cover_id)}"[^>]*href="([^"]+)"'
-                    item_match = re.search(item_pattern, opf_content, re.IGNORECASE)
-                    if not item_match:
-                        item_pattern = rf'<item[^>]*href="([^"]+)"[^>]*id="{re.escape(cover_id)}"'
-                        item_match = re.search(item_pattern, opf_content, re.IGNORECASE)
-                    if item_match:
-                        cover_href = item_match.group(1)
-
-                if not cover_href:
-                    cover_item_match = re.search(
-                        r'<item[^>]*(?:id="[^"]*cover[^"]*"|properties="[^"]*cover[^"]*")[^>]*href="([^"]+)"',
-                        opf_content, re.IGNORECASE
-                    )
-                    if not cover_item_match:
-                        cover_item_match = re.search(
-                            r'<item[^>]*href="([^"]+)"[^>]*(?:id="[^"]*cover[^"]*"|properties="[^"]*cover[^"]*")',
-                            opf_content, re.IGNORECASE
-                        )
-                    if cover_item_match:
-                        cover_href = cover_item_match.group(1)
+            if opf_bytes:
+                parsed = _parse_opf_xml(opf_bytes)
+                if parsed is None:
+                    parsed = _parse_opf_regex(opf_bytes)
+                opf_title, opf_author, cover_href = parsed
+                if opf_title:
+                    title = opf_title
+                if opf_author:
+                    author = opf_author
 
                 if cover_href and opf_path:
                     opf_dir = str(Path(opf_path).parent)
@@ -176,31 +430,35 @@ def extract_epub_metadata_fallback(epub_path: Path) -> dict:
                     else:
                         cover_full_path = cover_href
 
-                    from urllib.parse import unquote
                     cover_full_path = unquote(cover_full_path)
 
-                    for zf_name in zf.namelist():
-                        if zf_name == cover_full_path or zf_name.endswith(cover_href):
-                            try:
-                                cover_data = zf.read(zf_name)
-                                cover_image = Image.open(io.BytesIO(cover_data))
-                                break
-                            except:
-                                continue
+                    for zf_name in _cover_href_candidates(zf, lower_map, cover_full_path, cover_href):
+                        try:
+                            cover_bytes = _cover_bytes(zf.read(zf_name))
+                            break
+                        except:
+                            continue
 
             # Fallback: search for common cover image names
-            if cover_image is None:
-                cover_patterns = ['cover.jpg', 'cover.jpeg', 'cover.png', 'Cover.jpg', 'Cover.jpeg', 'Cover.png']
-                for name in zf.namelist():
-                    name_lower = name.lower()
-                    if any(p.lower() in name_lower for p in cover_patterns):
-                        if name_lower.endswith(('.jpg', '.jpeg', '.png', '.gif')):
-                            try:
-                                cover_data = zf.read(name)
-                                cover_image = Image.open(io.BytesIO(cover_data))
-                                break
-                            except:
-                                continue
+            if cover_bytes is None:
+                by_basename = {}
+                for name_lower, name in lower_map.items():
+                    by_basename.setdefault(name_lower.rpartition('/')[2], name)
+
+                # Exact file names first, in priority order, then any name containing one
+                candidates = [by_basename[c] for c in _COVER_NAMES if c in by_basename]
+                if not candidates:
+                    candidates = [
+                        name for name_lower, name in lower_map.items()
+                        if any(c in name_lower for c in _COVER_NAMES)
+                        and name_lower.endswith(('.jpg', '.jpeg', '.png', '.gif'))
+                    ]
+                for name in candidates:
+                    try:
+                        cover_bytes = _cover_bytes(zf.read(name))
+                        break
+                    except:
+                        continue
 
     except Exception as e:
         print(f"Error extracting EPUB metadata: {e}")
@@ -208,38 +466,266 @@ def extract_epub_metadata_fallback(epub_path: Path) -> dict:
     return {
         'title': title,
         'author': author,
-        'cover_image': cover_image
+        'cover_image_bytes': cover_bytes
     }
 
 
-def extract_metadata(file_path: Path) -> BookMetadata:
-    """Extract metadata from any supported ebook format."""
+def _cache_key(file_path: Path, st: os.stat_result) -> str:
+    """Cache key for a book file at its current size/mtime."""
+    raw = f"{file_path.resolve()}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.blake2b(raw.encode('utf-8', errors='surrogateescape'), digest_size=16).hexdigest()
+
+
+def _atomic_write(target: Path, write) -> None:
+    """Write via a temp file in the same dir, then rename into place."""
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _load_cached(file_path: Path, key: str) -> Optional[BookMetadata]:
+    """Return cached metadata for key, or None on a miss."""
+    json_path = config.METADATA_CACHE_DIR / f"{key}.json"
+    try:
+        with open(json_path, 'rb') as f:
+            data = json.load(f)
+        cover_bytes = None
+        if data.get('has_cover'):
+            cover_bytes = (config.METADATA_CACHE_DIR / f"{key}.jpg").read_bytes()
+        # Bump mtime so eviction drops the least recently used entries first
+        os.utime(json_path)
+    except (OSError, ValueError):
+        return None
+
+    return BookMetadata(
+        title=data['title'],
+        author=data['author'],
+        cover_image_bytes=cover_bytes,
+        file_path=file_path,
+        file_size=data['file_size'],
+        format=data['format']
+    )
+
+
+# Running estimate of the cache directory size; None until the first scan.
+# Only rescanned (and evicted) once the estimate goes over the cap.
+_cache_size: Optional[int] = None
+_cache_size_lock = threading.Lock()
+
+
+def _store_cached(key: str, meta: BookMetadata) -> None:
+    """Persist metadata (and cover) for key; failures are non-fatal."""
+    global _cache_size
+    cache_dir = config.METADATA_CACHE_DIR
+    written = 0
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        has_cover = False
+        if meta.cover_image_bytes:
+            _atomic_write(cache_dir / f"{key}.jpg", lambda f: f.write(meta.cover_image_bytes))
+            has_cover = True
+            written += len(meta.cover_image_bytes)
+
+        data = {
+            'title': meta.title,
+            'author': meta.author,
+            'file_size': meta.file_size,
+            'format': meta.format,
+            'has_cover': has_cover,
+        }
+        payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        # JSON goes last: its presence marks the entry as complete
+        _atomic_write(cache_dir / f"{key}.json", lambda f: f.write(payload))
+        written += len(payload)
+    except Exception as e:
+        print(f"Error writing metadata cache: {e}")
+        return
+
+    with _cache_size_lock:
+        if _cache_size is not None:
+            _cache_size += written
+            if _cache_size <= config.METADATA_CACHE_MAX_BYTES:
+                return
+        _cache_size = _evict_cache()
+
+
+def _evict_cache() -> Optional[int]:
+    """Drop least recently used entries until the cache fits its size cap.
+
+    Returns the remaining cache size, or None if the directory can't be read.
+    """
+    entries = {}
+    total = 0
+    try:
+        with os.scandir(config.METADATA_CACHE_DIR) as it:
+            for entry in it:
+                key, ext = os.path.splitext(entry.name)
+                if ext not in ('.json', '.jpg'):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                size, mtime = entries.get(key, (0, 0))
+                if ext == '.json':
+                    mtime = st.st_mtime_ns
+                entries[key] = (size + st.st_size, mtime)
+                total += st.st_size
+    except OSError:
+        return None
+
+    if total <= config.METADATA_CACHE_MAX_BYTES:
+        return total
+
+    for key, (size, _) in sorted(entries.items(), key=lambda kv: kv[1][1]):
+        for ext in ('.json', '.jpg'):
+            try:
+                os.unlink(config.METADATA_CACHE_DIR / f"{key}{ext}")
+            except OSError:
+                pass
+        total -= size
+        if total <= config.METADATA_CACHE_MAX_BYTES:
+            break
+    return total
+
+
+def _epub_fallback(file_path: Path) -> Optional[dict]:
+    """Read metadata straight from the zip for EPUBs; None for other formats."""
+    if file_path.suffix.lower() != '.epub':
+        return None
+    return extract_epub_metadata_fallback(file_path)
+
+
+def _fallback_complete(file_path: Path, fallback: Optional[dict]) -> bool:
+    """True when the EPUB fallback found title, author and cover."""
+    return bool(
+        fallback
+        and fallback.get('title') != file_path.stem
+        and fallback.get('author') != "Unknown Author"
+        and fallback.get('cover_image_bytes') is not None
+    )
+
+
+def _build_metadata(file_path: Path, calibre_meta: Optional[dict],
+                    fallback: Optional[dict] = None) -> BookMetadata:
+    """Combine Calibre results with the EPUB fallback into BookMetadata."""
     title = file_path.stem
     author = "Unknown Author"
-    cover_image = None
+    cover_bytes = None
 
-    # Try Calibre's ebook-meta first (fast, local)
-    calibre_meta = fetch_metadata_calibre(file_path)
     if calibre_meta:
         title = calibre_meta.get('title', title)
         author = calibre_meta.get('author', author)
-        cover_image = calibre_meta.get('cover_image')
+        cover_bytes = calibre_meta.get('cover_image_bytes')
 
-    # If we didn't get good metadata and it's an EPUB, try direct parsing
-    if (title == file_path.stem or author == "Unknown Author") and file_path.suffix.lower() == '.epub':
-        fallback = extract_epub_metadata_fallback(file_path)
+    # Fill anything Calibre didn't provide (or wasn't asked for) from the EPUB
+    if fallback:
         if title == file_path.stem and fallback.get('title'):
             title = fallback['title']
         if author == "Unknown Author" and fallback.get('author'):
             author = fallback['author']
-        if not cover_image and fallback.get('cover_image'):
-            cover_image = fallback['cover_image']
+        if not cover_bytes and fallback.get('cover_image_bytes'):
+            cover_bytes = fallback['cover_image_bytes']
 
     return BookMetadata(
         title=title,
         author=author,
-        cover_image=cover_image,
+        cover_image_bytes=cover_bytes,
         file_path=file_path,
         file_size=get_file_size_str(file_path),
         format=file_path.suffix.upper().strip('.')
-    )
\ No newline at end of file
+    )
+
+
+def placeholder_metadata(file_path: Path) -> BookMetadata:
+    """Filename-only metadata to show until extraction finishes."""
+    return _build_metadata(file_path, None)
+
+
+def _lookup_cache(file_path: Path):
+    """Return (cache key, cached metadata or None)."""
+    try:
+        key = _cache_key(file_path, file_path.stat())
+    except OSError:
+        return None, None
+    return key, _load_cached(file_path, key)
+
+
+def extract_metadata(file_path: Path) -> BookMetadata:
+    """Extract metadata from any supported ebook format."""
+    key, cached, fallback = _prepare_metadata(file_path)
+    if cached is not None:
+        return cached
+
+    # EPUBs are read directly; Calibre only fills in what the zip lacks
+    calibre_meta = None
+    if not _fallback_complete(file_path, fallback):
+        calibre_meta = fetch_metadata_calibre(file_path, get_cover=_needs_calibre_cover(fallback))
+    return _finish_metadata(file_path, key, calibre_meta, fallback)
+
+
+def _needs_calibre_cover(fallback: Optional[dict]) -> bool:
+    """Whether Calibre should extract the cover (the EPUB didn't provide one)."""
+    return not (fallback and fallback.get('cover_image_bytes') is not None)
+
+
+def _worth_caching(file_path: Path, calibre_meta: Optional[dict],
+                   fallback: Optional[dict]) -> bool:
+    """Only cache real results, so a Calibre timeout is retried next time."""
+    return calibre_meta is not None or _fallback_complete(file_path, fallback)
+
+
+def _prepare_metadata(file_path: Path):
+    """Cache lookup plus the EPUB zip read; returns (key, cached, fallback)."""
+    key, cached = _lookup_cache(file_path)
+    fallback = _epub_fallback(file_path) if cached is None else None
+    return key, cached, fallback
+
+
+def _finish_metadata(file_path: Path, key: Optional[str], calibre_meta: Optional[dict],
+                     fallback: Optional[dict]) -> BookMetadata:
+    """Build the final metadata and store it in the cache."""
+    meta = _build_metadata(file_path, calibre_meta, fallback)
+    if key and _worth_caching(file_path, calibre_meta, fallback):
+        _store_cached(key, meta)
+    return meta
+
+
+def extract_metadata_batch(paths: List[Path]) -> List[BookMetadata]:
+    """Extract metadata for several files, overlapping zip reads and Calibre calls."""
+    paths = [Path(p) for p in paths]
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        # zlib and file I/O release the GIL, so EPUBs decompress in parallel
+        prepared = list(pool.map(_prepare_metadata, paths))
+
+        misses = [
+            i for i, (_, cached, fallback) in enumerate(prepared)
+            if cached is None and not _fallback_complete(paths[i], fallback)
+        ]
+        calibre_metas = fetch_metadata_calibre_batch(
+            [paths[i] for i in misses],
+            [_needs_calibre_cover(prepared[i][2]) for i in misses],
+        )
+        calibre_by_index = dict(zip(misses, calibre_metas))
+
+        todo = [i for i, (_, cached, _) in enumerate(prepared) if cached is None]
+        built = pool.map(
+            lambda i: _finish_metadata(paths[i], prepared[i][0], calibre_by_index.get(i), prepared[i][2]),
+            todo
+        )
+        results = [cached for _, cached, _ in prepared]
+        for i, meta in zip(todo, built):
+            results[i] = meta
+
+    return results
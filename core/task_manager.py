@@ -1,13 +1,19 @@
 """Manages the queue of books to process."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
+import itertools
+import logging
 import threading
-import uuid as uuid_module
 
 from core.metadata import BookMetadata
 
+logger = logging.getLogger(__name__)
+
+# Task ids only need to be unique within this process
+_task_ids = itertools.count(1)
+
 
 class TaskStatus(Enum):
     QUEUED = "queued"
@@ -31,11 +37,12 @@ class BookTask:
     error_message: str = ""
     send_to_kindle: bool = True
     save_to_folder: Optional[Path] = None
+    card: Optional[Any] = field(default=None, repr=False, compare=False)  # UI widget showing this task
 
     @classmethod
     def create(cls, metadata: BookMetadata, output_format: str) -> "BookTask":
         return cls(
-            id=str(uuid_module.uuid4())[:8],
+            id=f"{next(_task_ids):08x}",
             metadata=metadata,
             output_format=output_format
         )
@@ -43,55 +50,113 @@ class BookTask:
 
 class TaskManager:
     def __init__(self):
-        self.tasks: List[BookTask] = []
-        self._lock = threading.Lock()
+        self._tasks: Dict[str, BookTask] = {}  # id -> task, in insertion order
+        # Immutable view republished by writers; readers use it without locking
+        self._snapshot: Tuple[BookTask, ...] = ()
+        # status -> {id: task}, kept current by set_status
+        self._by_status: Dict[TaskStatus, Dict[str, BookTask]] = {s: {} for s in TaskStatus}
+        # id -> position it was added at, so status lookups keep the queue order
+        self._order: Dict[str, int] = {}
+        self._added = itertools.count()
+        # Re-entrant: update_task(status=...) goes through set_status
+        self._lock = threading.RLock()
+        # Called on the mutating thread; listeners coalesce on their own (UI) side
         self._update_callbacks: List[Callable[[], None]] = []
 
+    @property
+    def tasks(self) -> Tuple[BookTask, ...]:
+        return self._snapshot
+
+    def _publish(self):
+        """Rebuild the read snapshot; call with the lock held."""
+        self._snapshot = tuple(self._tasks.values())
+
+    def set_status(self, task: BookTask, status: TaskStatus):
+        """Change a task's status, keeping the status index current."""
+        with self._lock:
+            old = task.status
+            task.status = status
+            if old is not status and self._tasks.get(task.id) is task:
+                self._by_status[old].pop(task.id, None)
+                self._by_status[status][task.id] = task
+
+    def _detach(self, task: BookTask):
+        """Stop tracking a removed task; call with the lock held."""
+        self._by_status[task.status].pop(task.id, None)
+        self._order.pop(task.id, None)
+
+    def iter_by_status(self, *statuses: TaskStatus) -> Tuple[BookTask, ...]:
+        """Tasks currently in any of the given statuses, in the order they were added."""
+        with self._lock:
+            found = [t for s in statuses for t in self._by_status[s].values()]
+            found.sort(key=lambda t: self._order[t.id])
+            return tuple(found)
+
     def add_update_callback(self, callback: Callable[[], None]):
         self._update_callbacks.append(callback)
 
     def _notify_update(self):
+        """Tell listeners the task list changed."""
         for cb in self._update_callbacks:
             try:
                 cb()
-            except Exception as e:
-                print(f"Update callback error: {e}")
+            except Exception:
+                logger.exception("Update callback error")
 
     def add_task(self, task: BookTask):
         with self._lock:
-            self.tasks.append(task)
+            self._tasks[task.id] = task
+            self._by_status[task.status][task.id] = task
+            self._order[task.id] = next(self._added)
+            self._publish()
         self._notify_update()
 
     def remove_task(self, task_id: str):
         with self._lock:
-            self.tasks = [t for t in self.tasks if t.id != task_id]
+            task = self._tasks.pop(task_id, None)
+            if task is not None:
+                self._detach(task)
+                self._publish()
         self._notify_update()
 
-    def get_task(self, task_id: str) -> Optional[BookTask]:
+    def remove_tasks(self, task_ids):
+        """Remove several tasks with a single snapshot rebuild and notification."""
         with self._lock:
-            for task in self.tasks:
-                if task.id == task_id:
-                    return task
-        return None
+            for task_id in task_ids:
+                task = self._tasks.pop(task_id, None)
+                if task is not None:
+                    self._detach(task)
+            self._publish()
+        self._notify_update()
+
+    def get_task(self, task_id: str) -> Optional[BookTask]:
+        return self._tasks.get(task_id)
 
     def update_task(self, task_id: str, **kwargs):
         with self._lock:
-            for task in self.tasks:
-                if task.id == task_id:
-                    for key, value in kwargs.items():
+            task = self._tasks.get(task_id)
+            if task:
+                for key, value in kwargs.items():
+                    if key == 'status':
+                        self.set_status(task, value)
+                    else:
                         setattr(task, key, value)
-                    break
         self._notify_update()
 
     def get_pending_tasks(self) -> List[BookTask]:
-        with self._lock:
-            return [t for t in self.tasks if t.status == TaskStatus.QUEUED]
+        return list(self.iter_by_status(TaskStatus.QUEUED))
+
+    def iter_tasks(self) -> Tuple[BookTask, ...]:
+        """All tasks in insertion order (a lock-free snapshot)."""
+        return self._snapshot
 
     def get_all_tasks(self) -> List[BookTask]:
-        with self._lock:
-            return list(self.tasks)
+        return list(self._snapshot)
 
     def clear_completed(self):
         with self._lock:
-            self.tasks = [t for t in self.tasks if t.status not in (TaskStatus.COMPLETED, TaskStatus.FAILED)]
+            for task in self.iter_by_status(TaskStatus.COMPLETED, TaskStatus.FAILED):
+                del self._tasks[task.id]
+                self._detach(task)
+            self._publish()
         self._notify_update()
\ No newline at end of file
@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
 """Kindle Sender - Entry point."""
+import functools
+import logging
 import sys
 import os
 from pathlib import Path
 
-# === WINDOWS TASKBAR IDENTITY - MUST BE FIRST ===
-if sys.platform == 'win32':
-    try:
-        import ctypes
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID('CCI.KindleSender.1')
-    except Exception:
-        pass
+
+def set_app_identity():
+    """Windows taskbar identity - must run before any window is created."""
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID('CCI.KindleSender.1')
+        except Exception:
+            pass
 
 
 def get_resource_path(filename: str) -> Path:
@@ -36,7 +40,6 @@ def set_window_icon(window):
     # Taskbar icon (uses PNG via PhotoImage)
     try:
         from PIL import Image, ImageTk
-        import tkinter as tk
 
         # Try PNG first, fall back to ICO
         if png_path.exists():
@@ -46,8 +49,11 @@ def set_window_icon(window):
         else:
             return
 
-        # Resize for taskbar (Windows uses 32x32 for taskbar)
-        img = img.resize((32, 32), Image.Resampling.LANCZOS)
+        # Resize for taskbar (Windows uses 32x32 for taskbar); large sources
+        # get a cheap box reduction first, then a bilinear pass to size
+        if img.width >= 256 and img.height >= 256:
+            img.thumbnail((64, 64), Image.Resampling.BOX)
+        img = img.resize((32, 32), Image.Resampling.BILINEAR)
 
         # Convert to PhotoImage
         photo = ImageTk.PhotoImage(img)
@@ -62,23 +68,34 @@ def set_window_icon(window):
         print(f"iconphoto failed: {e}")
 
 
-# Import CustomTkinter AFTER setting AppUserModelID
-import customtkinter as ctk
+@functools.lru_cache(maxsize=None)
+def init_ctk():
+    """Import and configure CustomTkinter (after the AppUserModelID is set).
 
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
+    Called by whichever path creates a window; later calls return the cached module.
+    """
+    import customtkinter as ctk
+
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+    return ctk
 
 
 def main():
     from core.calibre_setup import is_ready, get_bundled_zip
 
+    logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+    set_app_identity()
+
     if is_ready():
+        init_ctk()
         from ui.app import KindleSenderApp
         app = KindleSenderApp()
         set_window_icon(app)
         app.mainloop()
 
     elif get_bundled_zip().exists():
+        init_ctk()
         from ui.launcher import Launcher
         launcher = Launcher()
         set_window_icon(launcher)
@@ -91,6 +108,8 @@ def main():
 def show_error():
     from ui.themes import THEME
 
+    ctk = init_ctk()
+
     root = ctk.CTk()
     root.title("Kindle Sender - Error")
     root.geometry("400x150")
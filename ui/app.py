@@ -2,21 +2,28 @@
 import customtkinter as ctk
 from tkinterdnd2 import TkinterDnD
 from tkinter import filedialog
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List
+import shutil
+import sys
+import traceback
 
-from ui.themes import THEME
+from ui.themes import THEME, font
 from ui.components.drop_zone import DropZone
 from ui.components.book_card import BookCard
 from ui.components.kindle_status import KindleStatusBar
 from ui.components.format_selector import FormatSelector
 
-from core.metadata import extract_metadata
+from core.metadata import extract_metadata_batch, placeholder_metadata
 from core.converter import Converter
 from core.kindle import KindleManager
 from core.task_manager import TaskManager, BookTask, TaskStatus
 import config
 
+_FILETYPES = (config.EBOOK_FILETYPES, ("All files", "*.*"))
+
 
 class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
     def __init__(self):
@@ -36,8 +43,21 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.kindle_manager = KindleManager()
         self.task_manager = TaskManager()
 
+        # Conversions run on the converter's own bounded event loop; transfers
+        # go one at a time since the Kindle is a single USB device
+        self._transfer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transfer")
+        # Local file copies (Save to Folder)
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="io")
+        # Metadata batches (each batch fans out internally)
+        self._metadata_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metadata")
+
         self.output_format = config.DEFAULT_OUTPUT_FORMAT
-        self.book_cards: dict[str, BookCard] = {}
+
+        # Kindle connection events arrive in bursts while the device enumerates
+        self._kindle_update_pending = False
+        self._last_device = None
+        # after() id of the pending task-count relabel, so bursts relabel once
+        self._count_refresh = None
 
         # Build UI
         self._create_widgets()
@@ -49,6 +69,30 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         # Task manager updates
         self.task_manager.add_update_callback(self._refresh_task_list)
 
+    def destroy(self):
+        # Drop queued work; running jobs finish on their worker threads
+        self._transfer_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._metadata_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+    def _run_in_pool(self, pool: ThreadPoolExecutor, fn, on_complete, *args, **kwargs):
+        """Run fn(*args, **kwargs) on pool, then call on_complete(result, error)."""
+        def done(future):
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error:
+                print(f"Background task error: {error}")
+                traceback.print_exception(type(error), error, error.__traceback__)
+                on_complete(None, error)
+            else:
+                on_complete(future.result(), None)
+
+        future = pool.submit(fn, *args, **kwargs)
+        future.add_done_callback(done)
+        return future
+
     def _configure_window_size(self):
         """Configure window size adaptively based on screen dimensions."""
         screen_width = self.winfo_screenwidth()
@@ -71,9 +115,6 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _set_icon(self):
         """Set the window icon."""
-        import sys
-        from pathlib import Path
-
         if getattr(sys, 'frozen', False):
             # Running as EXE - icon is embedded
             pass  # Windows uses exe icon automatically
@@ -98,7 +139,7 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
             corner_radius=10,
             fg_color=THEME["accent"],
             hover_color=THEME["accent_hover"],
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=font(14, "bold"),
             command=self._convert_all
         )
         self.convert_all_btn.pack(side="left", padx=20, pady=11)
@@ -113,7 +154,7 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
             hover_color=THEME["success_light"],
             text_color="#ffffff",
             text_color_disabled="#9ca3af",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=font(14, "bold"),
             command=self._send_to_kindle,
             state="disabled"
         )
@@ -129,7 +170,7 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             header,
             text="📱 Kindle Sender",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=font(24, "bold"),
             text_color=THEME["text_primary"]
         ).grid(row=0, column=0, sticky="w")
 
@@ -167,7 +208,7 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
             corner_radius=10,
             fg_color=THEME["bg_tertiary"],
             hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=13),
+            font=font(13),
             command=self._browse_files
         )
         self.add_files_btn.pack(side="left", padx=(0, 10))
@@ -180,7 +221,7 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
             corner_radius=10,
             fg_color=THEME["bg_tertiary"],
             hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=13),
+            font=font(13),
             command=self._save_to_folder
         )
         self.save_folder_btn.pack(side="left", padx=(0, 10))
@@ -193,7 +234,7 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
             corner_radius=10,
             fg_color=THEME["bg_tertiary"],
             hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=13),
+            font=font(13),
             command=self._clear_completed
         )
         self.clear_btn.pack(side="left")
@@ -205,14 +246,14 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             list_header,
             text="Books Queue",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=font(16, "bold"),
             text_color=THEME["text_primary"]
         ).pack(side="left")
 
         self.task_count_label = ctk.CTkLabel(
             list_header,
             text="0 books",
-            font=ctk.CTkFont(size=12),
+            font=font(12),
             text_color=THEME["text_dim"]
         )
         self.task_count_label.pack(side="right")
@@ -229,7 +270,7 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.empty_label = ctk.CTkLabel(
             self.task_list_frame,
             text="No books added yet.\nDrag & drop files above or click 'Add Files'",
-            font=ctk.CTkFont(size=14),
+            font=font(14),
             text_color=THEME["text_dim"],
             justify="center"
         )
@@ -239,8 +280,18 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.output_format = format
 
     def _on_kindle_connection_change(self, device):
-        """Called when Kindle connection state changes."""
-        self.after(0, lambda: self._update_kindle_ui(device))
+        """Called when Kindle connection state changes.
+
+        Runs on the monitor thread; bursts are collapsed into one UI update.
+        """
+        self._last_device = device
+        if not self._kindle_update_pending:
+            self._kindle_update_pending = True
+            self.after(50, self._flush_kindle_ui)
+
+    def _flush_kindle_ui(self):
+        self._kindle_update_pending = False
+        self._update_kindle_ui(self._last_device)
 
     def _update_kindle_ui(self, device):
         self.kindle_status.update_status(device)
@@ -254,49 +305,65 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _on_files_dropped(self, files: List[Path]):
         """Handle dropped files."""
-        for file_path in files:
-            self._add_book(file_path)
+        self._add_books(files)
 
     def _browse_files(self):
         """Open file browser."""
-        filetypes = [
-            ("Ebook files", " ".join(f"*{ext}" for ext in config.INPUT_FORMATS)),
-            ("All files", "*.*")
-        ]
-        files = filedialog.askopenfilenames(filetypes=filetypes)
-        for f in files:
-            self._add_book(Path(f))
-
-    def _add_book(self, file_path: Path):
-        """Add a book to the queue."""
-        metadata = extract_metadata(file_path)
-        task = BookTask.create(metadata, self.output_format)
-        self.task_manager.add_task(task)
-        self._create_book_card(task)
+        files = filedialog.askopenfilenames(filetypes=_FILETYPES)
+        self._add_books([Path(f) for f in files])
 
-    def _create_book_card(self, task: BookTask):
-        """Create a book card widget."""
+    def _add_books(self, file_paths: List[Path]):
+        """Queue books right away; their metadata is extracted as one batch in the background."""
+        if not file_paths:
+            return
+
+        # Hold the list's size while the cards are packed, then lay out once
         self.empty_label.pack_forget()
+        self.task_list_frame.pack_propagate(False)
+        tasks = []
+        for file_path in file_paths:
+            task = BookTask.create(placeholder_metadata(file_path), self.output_format)
+            self.task_manager.add_task(task)
+            self._create_book_card(task)
+            tasks.append(task)
+        self.task_list_frame.pack_propagate(True)
+        self.task_list_frame.update_idletasks()
+        self._update_task_count()
+
+        def on_complete(results, error):
+            if not error:
+                self.after(0, partial(self._apply_metadata, tasks, results))
+
+        self._run_in_pool(self._metadata_pool, extract_metadata_batch, on_complete, file_paths)
+
+    def _apply_metadata(self, tasks: List[BookTask], results):
+        """Swap the placeholder metadata for the extracted metadata."""
+        for task, metadata in zip(tasks, results):
+            task.metadata = metadata
+            if task.card:
+                task.card.set_metadata(metadata)
 
+    def _create_book_card(self, task: BookTask):
+        """Create a book card widget."""
         card = BookCard(
             self.task_list_frame,
             task,
-            on_remove=self._remove_task
+            on_remove=self._remove_task,
+            set_status=self.task_manager.set_status
         )
         card.pack(fill="x", pady=5)
-        self.book_cards[task.id] = card
-
-        self._update_task_count()
+        task.card = card
 
     def _remove_task(self, task_id: str):
         """Remove a task from the queue."""
-        if task_id in self.book_cards:
-            self.book_cards[task_id].destroy()
-            del self.book_cards[task_id]
+        task = self.task_manager.get_task(task_id)
+        if task and task.card:
+            task.card.destroy()
+            task.card = None
         self.task_manager.remove_task(task_id)
         self._update_task_count()
 
-        if not self.book_cards:
+        if not self.task_manager.tasks:
             self.empty_label.pack(pady=40)
 
     def _update_task_count(self):
@@ -304,31 +371,33 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.task_count_label.configure(text=f"{count} book{'s' if count != 1 else ''}")
 
     def _refresh_task_list(self):
-        """Refresh the task list UI."""
-        self.after(0, self._update_task_count)
+        """Refresh the task list UI, once per burst of task-list changes."""
+        if self._count_refresh is None:
+            self._count_refresh = self.after(50, self._flush_task_count)
+
+    def _flush_task_count(self):
+        self._count_refresh = None
+        self._update_task_count()
 
     def _convert_all(self):
         """Start converting all pending books."""
-        tasks = self.task_manager.get_all_tasks()
-        pending = [t for t in tasks if t.status == TaskStatus.QUEUED]
-
-        for task in pending:
+        for task in self.task_manager.iter_by_status(TaskStatus.QUEUED):
             self._convert_task(task)
 
     def _convert_task(self, task: BookTask, then_send: bool = False):
         """Convert a single task."""
-        card = self.book_cards.get(task.id)
+        card = task.card
         if not card:
             return
 
         def on_progress(progress, message):
-            self.after(0, lambda: card.update_progress(progress, TaskStatus.CONVERTING))
+            card.update_progress(progress)
 
         def on_complete(result, error):
             def update():
                 try:
                     if error:
-                        task.status = TaskStatus.FAILED
+                        self.task_manager.set_status(task, TaskStatus.FAILED)
                         task.error_message = str(error)
                         card.update_status(TaskStatus.FAILED, str(error))
                     else:
@@ -343,25 +412,22 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
                             task.cover_path = None
                             task.mobi_asin = None
 
-                        task.status = TaskStatus.CONVERTED
-                        card.update_progress(100, TaskStatus.CONVERTED)
-                        card.update_status(TaskStatus.CONVERTED)
+                        self.task_manager.set_status(task, TaskStatus.CONVERTED)
+                        card.set_state(100, TaskStatus.CONVERTED)
 
                         if then_send and self.kindle_manager.is_connected:
                             self._transfer_task(task)
                 except Exception as e:
                     print(f"Error in conversion completion handler: {e}")
-                    import traceback
                     traceback.print_exc()
-                    task.status = TaskStatus.FAILED
+                    self.task_manager.set_status(task, TaskStatus.FAILED)
                     task.error_message = str(e)
                     card.update_status(TaskStatus.FAILED, str(e))
 
             self.after(0, update)
 
-        task.status = TaskStatus.CONVERTING
-        card.update_status(TaskStatus.CONVERTING)
-        card.update_progress(0, TaskStatus.CONVERTING)
+        self.task_manager.set_status(task, TaskStatus.CONVERTING)
+        card.set_state(0, TaskStatus.CONVERTING)
 
         output_format = "azw3" if then_send else self.output_format
 
@@ -377,49 +443,46 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         if not self.kindle_manager.is_connected:
             return
 
-        tasks = self.task_manager.get_all_tasks()
+        tasks = self.task_manager.iter_by_status(TaskStatus.CONVERTED, TaskStatus.QUEUED)
 
         for task in tasks:
-            if task.status == TaskStatus.COMPLETED:
-                continue
-            elif task.status == TaskStatus.CONVERTED and task.converted_path:
+            if task.status == TaskStatus.CONVERTED and task.converted_path:
                 if task.converted_path.suffix.lower() == '.azw3':
                     self._transfer_task(task)
                 else:
                     # Need to re-convert to AZW3
-                    task.status = TaskStatus.QUEUED
+                    self.task_manager.set_status(task, TaskStatus.QUEUED)
                     self._convert_task(task, then_send=True)
             elif task.status == TaskStatus.QUEUED:
                 self._convert_task(task, then_send=True)
 
     def _transfer_task(self, task: BookTask):
         """Transfer a converted book to Kindle."""
-        card = self.book_cards.get(task.id)
+        card = task.card
         if not card:
             return
 
         def on_progress(progress):
-            self.after(0, lambda: card.update_progress(progress, TaskStatus.TRANSFERRING))
+            card.update_progress(progress)
 
         def on_complete(success, error):
             def update():
                 try:
                     if error:
-                        task.status = TaskStatus.FAILED
+                        self.task_manager.set_status(task, TaskStatus.FAILED)
                         task.error_message = str(error)
                         card.update_status(TaskStatus.FAILED, str(error))
                     else:
-                        task.status = TaskStatus.COMPLETED
-                        card.update_progress(100, TaskStatus.COMPLETED)
-                        card.update_status(TaskStatus.COMPLETED)
+                        self.task_manager.set_status(task, TaskStatus.COMPLETED)
+                        card.set_state(100, TaskStatus.COMPLETED)
                 except Exception as e:
                     print(f"Error in transfer completion handler: {e}")
-                    task.status = TaskStatus.FAILED
+                    self.task_manager.set_status(task, TaskStatus.FAILED)
                     card.update_status(TaskStatus.FAILED, str(e))
 
             self.after(0, update)
 
-        task.status = TaskStatus.TRANSFERRING
+        self.task_manager.set_status(task, TaskStatus.TRANSFERRING)
         card.update_status(TaskStatus.TRANSFERRING)
 
         # Get cover and mobi_asin for thumbnail creation
@@ -427,18 +490,19 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         mobi_asin = getattr(task, 'mobi_asin', None)
 
         try:
-            self.kindle_manager.transfer_file_async(
+            self._run_in_pool(
+                self._transfer_pool,
+                self.kindle_manager.transfer_file,
+                on_complete,
                 task.converted_path,
                 cover_path=cover_path,
                 mobi_asin=mobi_asin,
-                progress_callback=on_progress,
-                completion_callback=on_complete
+                progress_callback=on_progress
             )
         except Exception as e:
             print(f"Failed to start transfer: {e}")
-            import traceback
             traceback.print_exc()
-            task.status = TaskStatus.FAILED
+            self.task_manager.set_status(task, TaskStatus.FAILED)
             task.error_message = str(e)
             card.update_status(TaskStatus.FAILED, str(e))
 
@@ -449,42 +513,53 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
             return
 
         folder = Path(folder)
-        tasks = self.task_manager.get_all_tasks()
+        tasks = self.task_manager.iter_by_status(TaskStatus.CONVERTED, TaskStatus.QUEUED)
 
         for task in tasks:
             if task.status == TaskStatus.CONVERTED and task.converted_path:
-                import shutil
-                dest = folder / task.converted_path.name
-                shutil.copy2(task.converted_path, dest)
-
-                task.status = TaskStatus.COMPLETED
-                card = self.book_cards.get(task.id)
-                if card:
-                    card.update_progress(100, TaskStatus.COMPLETED)
-                    card.update_status(TaskStatus.COMPLETED)
+                self._copy_to_folder(task, task.converted_path, folder)
 
             elif task.status == TaskStatus.QUEUED:
                 self._convert_and_save(task, folder)
 
+    def _copy_to_folder(self, task: BookTask, src: Path, folder: Path):
+        """Copy a converted file into folder off the Tk thread, then mark the task done."""
+        card = task.card
+
+        def on_complete(_, error):
+            def update():
+                if error:
+                    self.task_manager.set_status(task, TaskStatus.FAILED)
+                    task.error_message = str(error)
+                    if card:
+                        card.update_status(TaskStatus.FAILED, str(error))
+                else:
+                    self.task_manager.set_status(task, TaskStatus.COMPLETED)
+                    if card:
+                        card.set_state(100, TaskStatus.COMPLETED)
+
+            self.after(0, update)
+
+        # copy2 -> copyfile uses sendfile/fcopyfile fast paths where available
+        self._run_in_pool(self._io_pool, shutil.copy2, on_complete, src, folder / src.name)
+
     def _convert_and_save(self, task: BookTask, folder: Path):
         """Convert a task and save to folder."""
-        card = self.book_cards.get(task.id)
+        card = task.card
         if not card:
             return
 
         def on_progress(progress, message):
-            self.after(0, lambda: card.update_progress(progress, TaskStatus.CONVERTING))
+            card.update_progress(progress)
 
         def on_complete(result, error):
             def update():
                 try:
                     if error:
-                        task.status = TaskStatus.FAILED
+                        self.task_manager.set_status(task, TaskStatus.FAILED)
                         task.error_message = str(error)
                         card.update_status(TaskStatus.FAILED, str(error))
                     else:
-                        import shutil
-
                         # Handle ConversionResult object
                         if hasattr(result, 'output_path'):
                             output_path = result.output_path
@@ -494,27 +569,22 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
                             task.cover_path = None
 
                         if output_path and output_path.exists():
-                            dest = folder / output_path.name
-                            shutil.copy2(output_path, dest)
                             task.converted_path = output_path
-                            task.status = TaskStatus.COMPLETED
-                            card.update_progress(100, TaskStatus.COMPLETED)
-                            card.update_status(TaskStatus.COMPLETED)
+                            self._copy_to_folder(task, output_path, folder)
                         else:
-                            task.status = TaskStatus.FAILED
+                            self.task_manager.set_status(task, TaskStatus.FAILED)
                             task.error_message = "Output file not found"
                             card.update_status(TaskStatus.FAILED, "Output file not found")
                 except Exception as e:
                     print(f"Error in save completion handler: {e}")
-                    task.status = TaskStatus.FAILED
+                    self.task_manager.set_status(task, TaskStatus.FAILED)
                     task.error_message = str(e)
                     card.update_status(TaskStatus.FAILED, str(e))
 
             self.after(0, update)
 
-        task.status = TaskStatus.CONVERTING
-        card.update_status(TaskStatus.CONVERTING)
-        card.update_progress(0, TaskStatus.CONVERTING)
+        self.task_manager.set_status(task, TaskStatus.CONVERTING)
+        card.set_state(0, TaskStatus.CONVERTING)
 
         self.converter.convert_async(
             task.metadata.file_path,
@@ -525,9 +595,19 @@ class KindleSenderApp(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _clear_completed(self):
         """Remove completed tasks from the list."""
-        to_remove = [
-            task_id for task_id, card in self.book_cards.items()
-            if card.task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
-        ]
-        for task_id in to_remove:
-            self._remove_task(task_id)
\ No newline at end of file
+        done = self.task_manager.iter_by_status(TaskStatus.COMPLETED, TaskStatus.FAILED)
+        if not done:
+            return
+
+        # Destroy every card under one layout pass, then relabel once
+        self.task_list_frame.pack_propagate(False)
+        for task in done:
+            if task.card:
+                task.card.destroy()
+                task.card = None
+        self.task_manager.clear_completed()
+        self.task_list_frame.pack_propagate(True)
+
+        self._update_task_count()
+        if not self.task_manager.tasks:
+            self.empty_label.pack(pady=40)
\ No newline at end of file
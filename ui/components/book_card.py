@@ -1,24 +1,94 @@
 """Book card component showing book info and progress."""
 import customtkinter as ctk
-from PIL import Image, ImageTk
+from PIL import Image
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from tkinter import TclError
+from types import SimpleNamespace
 from typing import Callable, Optional
+from core.metadata import BookMetadata
 from core.task_manager import BookTask, TaskStatus
-from ui.themes import THEME
-import io
+from ui.themes import THEME, font
+import functools
+import threading
+
+# Covers are decoded and shrunk off the Tk thread
+_thumb_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumb")
+
+# Finished CTkImages keyed by (path, mtime_ns), shared by cards showing the same
+# file (e.g. a book dropped again). Only touched from the Tk thread.
+_COVER_CACHE_SIZE = 256
+_cover_cache: "OrderedDict[tuple, ctk.CTkImage]" = OrderedDict()
+
+
+def _make_thumbnail(metadata: BookMetadata) -> Optional[Image.Image]:
+    """Decode the cover and shrink it to card size (runs on _thumb_pool)."""
+    image = metadata.cover_image
+    if image is None:
+        return None
+    image = image.copy()
+    image.thumbnail((60, 80), Image.Resampling.LANCZOS)
+    return image
+
+
+def _cover_key(path: Path) -> Optional[tuple]:
+    try:
+        return str(path), path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _assign_status(task: BookTask, status: TaskStatus):
+    task.status = status
+
+
+@functools.lru_cache(maxsize=None)
+def _blank_cover() -> ctk.CTkImage:
+    """Transparent cover used to clear a recycled card's image."""
+    image = Image.new("RGBA", (60, 80), (0, 0, 0, 0))
+    return ctk.CTkImage(light_image=image, dark_image=image, size=(60, 80))
+
+
+@functools.lru_cache(maxsize=None)
+def _style() -> SimpleNamespace:
+    """Colors and fonts shared by every card, built once the Tk root exists."""
+    return SimpleNamespace(
+        **{key: THEME[key] for key in (
+            "bg_card", "bg_tertiary", "text_primary", "text_secondary", "text_dim",
+            "progress_bg", "accent", "success", "error",
+        )},
+        title_font=font(14, "bold"),
+        info_font=font(11),
+        status_font=font(10),
+        remove_font=font(14),
+        placeholder_font=font(32),
+    )
 
 
 class BookCard(ctk.CTkFrame):
+    _STATUS_FMT = {
+        TaskStatus.QUEUED: "⏳ Waiting...",
+        TaskStatus.CONVERTING: "🔄 Converting... {p:.0f}%",
+        TaskStatus.CONVERTED: "✅ Converted - Ready to send",
+        TaskStatus.TRANSFERRING: "📤 Sending to Kindle... {p:.0f}%",
+        TaskStatus.COMPLETED: "✅ Done!",
+        TaskStatus.FAILED: "❌ Failed: {e}",
+    }
+
     def __init__(
         self,
         parent,
         task: BookTask,
         on_remove: Callable[[str], None],
+        set_status: Optional[Callable[[BookTask, TaskStatus], None]] = None,
         **kwargs
     ):
+        s = _style()
         super().__init__(
             parent,
-            fg_color=THEME["bg_card"],
+            fg_color=s.bg_card,
             corner_radius=10,
             height=100,
             **kwargs
@@ -26,6 +96,16 @@ class BookCard(ctk.CTkFrame):
 
         self.task = task
         self.on_remove = on_remove
+        # Status changes go through the owner (the TaskManager) so its index stays current
+        self._set_status = set_status or _assign_status
+        # Latest progress reported from a worker thread, applied by _flush_progress
+        self._pending_progress = None
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._current_color = s.accent
+        # Last values pushed to the widgets, so repeated ticks are no-ops
+        self._shown_value = 0
+        self._shown_text = None
 
         self.grid_columnconfigure(1, weight=1)
         self.grid_propagate(False)
@@ -37,10 +117,10 @@ class BookCard(ctk.CTkFrame):
             width=60,
             height=80,
             corner_radius=6,
-            fg_color=THEME["bg_tertiary"]
+            fg_color=s.bg_tertiary
         )
         self.cover_label.grid(row=0, column=0, rowspan=2, padx=10, pady=10, sticky="nsw")
-        self._set_cover_image(task.metadata.cover_image)
+        self._load_cover(task.metadata)
 
         # Info container
         info_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -51,19 +131,18 @@ class BookCard(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             info_frame,
             text=task.metadata.display_title,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=THEME["text_primary"],
+            font=s.title_font,
+            text_color=s.text_primary,
             anchor="w"
         )
         self.title_label.grid(row=0, column=0, sticky="w")
 
         # Author and format info
-        info_text = f"{task.metadata.author} • {task.metadata.file_size} • {task.metadata.format} → {task.output_format.upper()}"
         self.info_label = ctk.CTkLabel(
             info_frame,
-            text=info_text,
-            font=ctk.CTkFont(size=11),
-            text_color=THEME["text_secondary"],
+            text=self._get_info_text(),
+            font=s.info_font,
+            text_color=s.text_secondary,
             anchor="w"
         )
         self.info_label.grid(row=1, column=0, sticky="w", pady=(2, 0))
@@ -78,8 +157,8 @@ class BookCard(ctk.CTkFrame):
             progress_frame,
             height=6,
             corner_radius=3,
-            fg_color=THEME["progress_bg"],
-            progress_color=THEME["accent"]
+            fg_color=s.progress_bg,
+            progress_color=s.accent
         )
         self.progress_bar.grid(row=0, column=0, sticky="ew", pady=(0, 4))
         self.progress_bar.set(0)
@@ -88,8 +167,8 @@ class BookCard(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             progress_frame,
             text=self._get_status_text(),
-            font=ctk.CTkFont(size=10),
-            text_color=THEME["text_dim"],
+            font=s.status_font,
+            text_color=s.text_dim,
             anchor="w"
         )
         self.status_label.grid(row=1, column=0, sticky="w")
@@ -101,59 +180,166 @@ class BookCard(ctk.CTkFrame):
             width=30,
             height=30,
             corner_radius=15,
-            fg_color=THEME["bg_tertiary"],
-            hover_color=THEME["error"],
-            text_color=THEME["text_secondary"],
-            font=ctk.CTkFont(size=14),
-            command=lambda: self.on_remove(task.id)
+            fg_color=s.bg_tertiary,
+            hover_color=s.error,
+            text_color=s.text_secondary,
+            font=s.remove_font,
+            command=partial(on_remove, task.id)
         )
         self.remove_btn.grid(row=0, column=2, padx=10, pady=10, sticky="ne")
 
-    def _set_cover_image(self, image: Optional[Image.Image]):
+    def rebind(self, task: BookTask):
+        """Reuse this card for another task instead of building a new one."""
+        self.task = task
+        with self._pending_lock:
+            self._pending_progress = None
+        self.remove_btn.configure(command=partial(self.on_remove, task.id))
+        self.title_label.configure(text=task.metadata.display_title)
+        self.info_label.configure(text=self._get_info_text())
+        self._load_cover(task.metadata)
+        self._refresh()
+
+    def _get_info_text(self) -> str:
+        metadata = self.task.metadata
+        return f"{metadata.author} • {metadata.file_size} • {metadata.format} → {self.task.output_format.upper()}"
+
+    def set_metadata(self, metadata: BookMetadata):
+        """Show metadata that arrived after the card was created."""
+        self.task.metadata = metadata
+        self.title_label.configure(text=metadata.display_title)
+        self.info_label.configure(text=self._get_info_text())
+        self._load_cover(metadata)
+
+    def _load_cover(self, metadata: BookMetadata):
+        """Show a placeholder, then swap in the cover once it's thumbnailed."""
+        # Clear any previous book's cover so the placeholder isn't drawn over it
+        self.cover_label.configure(image=_blank_cover(), text="📖", font=_style().placeholder_font)
+        if not metadata.cover_image_bytes:
+            return
+
+        key = _cover_key(metadata.file_path)
+        cached = _cover_cache.get(key)
+        if cached is not None:
+            _cover_cache.move_to_end(key)
+            self._show_cover(cached)
+            return
+
+        def done(future):
+            if future.exception() is None and future.result() is not None:
+                try:
+                    self.after(0, partial(self._set_cover_image, future.result(), key, metadata))
+                except (TclError, RuntimeError):
+                    pass  # window is gone
+
+        _thumb_pool.submit(_make_thumbnail, metadata).add_done_callback(done)
+
+    def _set_cover_image(self, image: Image.Image, key: Optional[tuple] = None,
+                         metadata: Optional[BookMetadata] = None):
+        """Wrap a thumbnail in a CTkImage, cache it and show it."""
+        ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=(60, 80))
+        if key is not None:
+            _cover_cache[key] = ctk_image
+            if len(_cover_cache) > _COVER_CACHE_SIZE:
+                _cover_cache.popitem(last=False)
+        # The card may have been rebound to another book meanwhile
+        if metadata is None or self.task.metadata is metadata:
+            self._show_cover(ctk_image)
+
+    def _show_cover(self, ctk_image: ctk.CTkImage):
         """Set the cover image."""
-        if image:
-            # Resize to fit
-            image = image.copy()
-            image.thumbnail((60, 80), Image.Resampling.LANCZOS)
-            ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=(60, 80))
+        try:
             self.cover_label.configure(image=ctk_image, text="")
-        else:
-            self.cover_label.configure(text="📖", font=ctk.CTkFont(size=32))
+        except TclError:
+            pass  # card was removed while the thumbnail was being made
 
     def _get_status_text(self) -> str:
-        status_map = {
-            TaskStatus.QUEUED: "⏳ Waiting...",
-            TaskStatus.CONVERTING: f"🔄 Converting... {self.task.progress:.0f}%",
-            TaskStatus.CONVERTED: "✅ Converted - Ready to send",
-            TaskStatus.TRANSFERRING: f"📤 Sending to Kindle... {self.task.progress:.0f}%",
-            TaskStatus.COMPLETED: "✅ Done!",
-            TaskStatus.FAILED: f"❌ Failed: {self.task.error_message[:30]}",
-        }
-        return status_map.get(self.task.status, "Unknown")
+        template = self._STATUS_FMT.get(self.task.status, "Unknown")
+        if "{" not in template:
+            return template
+        return template.format(p=self.task.progress, e=self.task.error_message[:30])
 
     def update_progress(self, progress: float, status: Optional[TaskStatus] = None):
-        """Update progress bar and status."""
-        self.task.progress = progress
+        """Record progress; widgets refresh at most every 50 ms.
+
+        Safe to call from worker threads: only the latest value is kept here,
+        and the task and widgets are updated later on the Tk loop.
+        """
+        with self._pending_lock:
+            self._pending_progress = (progress, status)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            self.after(0, self._schedule_flush)
+        except (TclError, RuntimeError):
+            pass  # window is gone
+
+    def _schedule_flush(self):
+        self.after(50, self._flush_progress)
+
+    def _flush_progress(self):
+        """Apply the latest recorded progress to the task and widgets."""
+        with self._pending_lock:
+            pending, self._pending_progress = self._pending_progress, None
+            self._flush_scheduled = False
+        if pending is None or not self.winfo_exists():
+            return
+        progress, status = pending
         if status:
-            self.task.status = status
+            self._set_status(self.task, status)
+        self.task.progress = progress
+        self._refresh()
 
-        self.progress_bar.set(progress / 100)
-        self.status_label.configure(text=self._get_status_text())
+    def _refresh(self):
+        """Push the task's progress/status to the widgets, skipping unchanged ones."""
+        task = self.task
 
-        # Color coding
-        if self.task.status == TaskStatus.COMPLETED:
-            self.progress_bar.configure(progress_color=THEME["success"])
-        elif self.task.status == TaskStatus.FAILED:
-            self.progress_bar.configure(progress_color=THEME["error"])
+        value = task.progress / 100
+        if value != self._shown_value:
+            self._shown_value = value
+            self.progress_bar.set(value)
 
-    def update_status(self, status: TaskStatus, error: str = ""):
-        """Update task status."""
-        self.task.status = status
-        self.task.error_message = error
-        self.status_label.configure(text=self._get_status_text())
+        text = self._get_status_text()
+        if text != self._shown_text:
+            self._shown_text = text
+            self.status_label.configure(text=text)
 
+        # Color coding
+        s = _style()
+        status = task.status
         if status == TaskStatus.COMPLETED:
-            self.progress_bar.configure(progress_color=THEME["success"])
-            self.progress_bar.set(1.0)
+            color = s.success
         elif status == TaskStatus.FAILED:
-            self.progress_bar.configure(progress_color=THEME["error"])
\ No newline at end of file
+            color = s.error
+        else:
+            color = s.accent
+        if color != self._current_color:
+            self._current_color = color
+            self.progress_bar.configure(progress_color=color)
+
+    def set_state(
+        self,
+        progress: Optional[float] = None,
+        status: Optional[TaskStatus] = None,
+        error: str = ""
+    ):
+        """Update progress, status and error together with a single redraw."""
+        if status is not None:
+            self._set_status(self.task, status)
+            self.task.error_message = error
+            if status == TaskStatus.COMPLETED and progress is None:
+                progress = 100
+        # An explicit state supersedes progress still waiting to be flushed
+        with self._pending_lock:
+            self._pending_progress = None
+        if progress is not None:
+            self.task.progress = progress
+        self._refresh()
+
+    def finalize(self, state: TaskStatus, progress: float = 100, error: str = ""):
+        """Move the card to an end-of-step state (bar and label in one refresh)."""
+        self.set_state(progress, state, error)
+
+    def update_status(self, status: TaskStatus, error: str = ""):
+        """Update task status."""
+        self.set_state(status=status, error=error)
@@ -4,7 +4,7 @@ from tkinterdnd2 import DND_FILES
 from pathlib import Path
 from typing import Callable, List
 import config
-from ui.themes import THEME
+from ui.themes import THEME, font
 
 
 class DropZone(ctk.CTkFrame):
@@ -25,12 +25,14 @@ class DropZone(ctk.CTkFrame):
 
         self.on_files_dropped = on_files_dropped
         self._is_hovering = False
+        self._splitlist = self.tk.splitlist
+        self._valid_exts = config.INPUT_FORMATS_SET
 
         # Icon/emoji
         self.icon_label = ctk.CTkLabel(
             self,
             text="📚",
-            font=ctk.CTkFont(size=48)
+            font=font(48)
         )
         self.icon_label.pack(pady=(30, 10))
 
@@ -38,7 +40,7 @@ class DropZone(ctk.CTkFrame):
         self.text_label = ctk.CTkLabel(
             self,
             text="Drag & Drop Books Here",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=font(18, "bold"),
             text_color=THEME["text_primary"]
         )
         self.text_label.pack(pady=(0, 5))
@@ -48,7 +50,7 @@ class DropZone(ctk.CTkFrame):
         self.subtext_label = ctk.CTkLabel(
             self,
             text=f"Supports {formats}",
-            font=ctk.CTkFont(size=12),
+            font=font(12),
             text_color=THEME["text_dim"]
         )
         self.subtext_label.pack(pady=(0, 30))
@@ -63,24 +65,12 @@ class DropZone(ctk.CTkFrame):
         """Handle dropped files."""
         self._on_drag_leave(None)
 
-        # Parse file paths (handles spaces in names)
-        data = event.data
-        files = []
-
-        # Windows wraps paths with spaces in braces
-        if '{' in data:
-            import re
-            files = re.findall(r'\{([^}]+)\}|(\S+)', data)
-            files = [f[0] or f[1] for f in files]
-        else:
-            files = data.split()
+        # Tcl list of paths; paths with spaces come wrapped in braces
+        paths = [Path(f) for f in self._splitlist(event.data)]
 
         # Filter for supported formats
-        valid_files = []
-        for f in files:
-            path = Path(f)
-            if path.suffix.lower() in config.INPUT_FORMATS:
-                valid_files.append(path)
+        valid_exts = self._valid_exts
+        valid_files = [p for p in paths if p.suffix.lower() in valid_exts]
 
         if valid_files:
             self.on_files_dropped(valid_files)
@@ -2,7 +2,7 @@
 import customtkinter as ctk
 from typing import Callable
 import config
-from ui.themes import THEME
+from ui.themes import THEME, font
 
 
 class FormatSelector(ctk.CTkFrame):
@@ -21,7 +21,7 @@ class FormatSelector(ctk.CTkFrame):
         ctk.CTkLabel(
             self,
             text="Output Format:",
-            font=ctk.CTkFont(size=12),
+            font=font(12),
             text_color=THEME["text_secondary"]
         ).pack(side="left", padx=(0, 10))
 
@@ -39,7 +39,7 @@ class FormatSelector(ctk.CTkFrame):
             button_hover_color=THEME["bg_hover"],
             dropdown_fg_color=THEME["bg_secondary"],
             dropdown_hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=12)
+            font=font(12)
         )
         self.format_menu.pack(side="left")
 
@@ -1,17 +1,28 @@
 """Kindle connection status bar component."""
 import customtkinter as ctk
 from typing import Optional, Callable
-from ui.themes import THEME
+from ui.themes import (
+    BG_HOVER,
+    BG_SECONDARY,
+    BG_TERTIARY,
+    ERROR,
+    SUCCESS,
+    TEXT_DIM,
+    TEXT_PRIMARY,
+    TEXT_SECONDARY,
+    font,
+)
 
 
 class KindleStatusBar(ctk.CTkFrame):
     """Shows Kindle connection status."""
 
     def __init__(self, parent, on_refresh: Optional[Callable] = None, **kwargs):
-        super().__init__(parent, fg_color=THEME["bg_secondary"], corner_radius=12, height=50, **kwargs)
-        self.pack_propagate(False)
+        super().__init__(parent, fg_color=BG_SECONDARY, corner_radius=12, **kwargs)
 
         self.on_refresh = on_refresh
+        # (name, free space, connected) currently shown; starts as "not connected"
+        self._last_state = (None, None, False)
 
         # Status indicator
         self.status_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -20,16 +31,16 @@ class KindleStatusBar(ctk.CTkFrame):
         self.status_dot = ctk.CTkLabel(
             self.status_frame,
             text="●",
-            font=ctk.CTkFont(size=16),
-            text_color=THEME["error"]
+            font=font(16),
+            text_color=ERROR
         )
         self.status_dot.pack(side="left", padx=(0, 8))
 
         self.status_label = ctk.CTkLabel(
             self.status_frame,
             text="Kindle not connected",
-            font=ctk.CTkFont(size=13),
-            text_color=THEME["text_secondary"]
+            font=font(13),
+            text_color=TEXT_SECONDARY
         )
         self.status_label.pack(side="left")
 
@@ -40,8 +51,8 @@ class KindleStatusBar(ctk.CTkFrame):
         self.space_label = ctk.CTkLabel(
             self.info_frame,
             text="",
-            font=ctk.CTkFont(size=12),
-            text_color=THEME["text_dim"]
+            font=font(12),
+            text_color=TEXT_DIM
         )
         self.space_label.pack(side="left", padx=(0, 10))
 
@@ -51,9 +62,9 @@ class KindleStatusBar(ctk.CTkFrame):
             width=30,
             height=30,
             corner_radius=8,
-            fg_color=THEME["bg_tertiary"],
-            hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=14),
+            fg_color=BG_TERTIARY,
+            hover_color=BG_HOVER,
+            font=font(14),
             command=self._on_refresh_click
         )
         self.refresh_btn.pack(side="left")
@@ -64,17 +75,22 @@ class KindleStatusBar(ctk.CTkFrame):
 
     def update_status(self, device):
         """Update the status display based on device connection."""
+        state = (getattr(device, 'name', None), getattr(device, 'free_space', None), bool(device))
+        if state == self._last_state:
+            return
+        self._last_state = state
+
         if device:
-            self.status_dot.configure(text_color=THEME["success"])
+            self.status_dot.configure(text_color=SUCCESS)
             self.status_label.configure(
                 text=f"{device.name} connected",
-                text_color=THEME["text_primary"]
+                text_color=TEXT_PRIMARY
             )
             self.space_label.configure(text=f"Free: {device.free_space}")
         else:
-            self.status_dot.configure(text_color=THEME["error"])
+            self.status_dot.configure(text_color=ERROR)
             self.status_label.configure(
                 text="Kindle not connected",
-                text_color=THEME["text_secondary"]
+                text_color=TEXT_SECONDARY
             )
             self.space_label.configure(text="")
\ No newline at end of file
@@ -1,23 +1,60 @@
 """Launcher that handles setup then transitions to main app."""
+import logging
+import queue
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from tkinter import filedialog
 import customtkinter as ctk
 from tkinterdnd2 import TkinterDnD
 from pathlib import Path
-from ui.themes import THEME
+from ui.themes import (
+    ACCENT,
+    ACCENT_HOVER,
+    BG_HOVER,
+    BG_PRIMARY,
+    BG_SECONDARY,
+    BG_TERTIARY,
+    ERROR,
+    PROGRESS_BG,
+    SUCCESS,
+    SUCCESS_LIGHT,
+    TEXT_DIM,
+    TEXT_PRIMARY,
+    TEXT_SECONDARY,
+    font,
+)
 from core.calibre_setup import extract_async, is_ready
+import config
+
+_FILETYPES = (config.EBOOK_FILETYPES, ("All files", "*.*"))
+
+logger = logging.getLogger(__name__)
 
 
 class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
     """Single window that shows setup, then becomes the main app."""
 
+    UPDATE_INTERVAL_MS = 80  # progress ticks are coalesced and applied at this rate
+    MIN_PROGRESS_INTERVAL = 1 / 20  # seconds between forwarded ticks per task
+    UI_QUEUE_INTERVAL_MS = 30  # delay before callbacks posted by worker threads are run
+    CARD_POOL_SIZE = 32  # hidden BookCards kept for reuse
+
     def __init__(self):
         super().__init__()
         self.TkdndVersion = TkinterDnD._require(self)
 
+        # Screen size doesn't change during a session; query it once
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
+
         self.title("Kindle Sender")
         self.geometry("450x200")
         self.resizable(False, False)
-        self.configure(fg_color=THEME["bg_primary"])
+        self.configure(fg_color=BG_PRIMARY)
 
         # Center on screen
         self._center_window(450, 200)
@@ -26,6 +63,12 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._setup_complete = False
 
+        # (fn, args) posted by worker threads, run on the Tk thread by _drain_ui_queue.
+        # The drain is armed by the first post of a burst and doesn't reschedule itself.
+        self._ui_queue = queue.Queue()
+        self._ui_lock = threading.Lock()
+        self._drain_scheduled = False
+
         # Build setup UI
         self._build_setup_ui()
 
@@ -33,56 +76,91 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
         self.after(500, self._start_extraction)
 
     def _center_window(self, width, height):
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        x = (screen_width - width) // 2
-        y = max(0, (screen_height - height) // 2 - 40)
+        x = (self._screen_w - width) // 2
+        y = max(0, (self._screen_h - height) // 2 - 40)
         self.geometry(f"{width}x{height}+{x}+{y}")
 
     def _build_setup_ui(self):
         """Build the setup screen UI."""
         self.setup_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.setup_frame.pack(fill="both", expand=True)
+        # Fixed-width column so changing status text doesn't re-layout the frame
+        self.setup_frame.grid_columnconfigure(0, minsize=400, weight=1)
 
         ctk.CTkLabel(
             self.setup_frame,
             text="📚 First Run Setup",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=THEME["text_primary"]
-        ).pack(pady=(30, 10))
+            font=font(20, "bold"),
+            text_color=TEXT_PRIMARY
+        ).grid(row=0, column=0, pady=(30, 10))
 
         self.status_label = ctk.CTkLabel(
             self.setup_frame,
             text="Preparing conversion tools...",
-            font=ctk.CTkFont(size=13),
-            text_color=THEME["text_secondary"]
+            font=font(13),
+            text_color=TEXT_SECONDARY,
+            width=400
         )
-        self.status_label.pack(pady=5)
+        self.status_label.grid(row=1, column=0, pady=5)
 
         self.progress_bar = ctk.CTkProgressBar(
             self.setup_frame,
             width=350,
             height=10,
             corner_radius=5,
-            fg_color=THEME["progress_bg"],
-            progress_color=THEME["accent"]
+            fg_color=PROGRESS_BG,
+            progress_color=ACCENT
         )
-        self.progress_bar.pack(pady=15)
+        self.progress_bar.grid(row=2, column=0, pady=15)
         self.progress_bar.set(0)
 
         self.hint_label = ctk.CTkLabel(
             self.setup_frame,
             text="This only happens once...",
-            font=ctk.CTkFont(size=11),
-            text_color=THEME["text_dim"]
+            font=font(11),
+            text_color=TEXT_DIM
         )
-        self.hint_label.pack()
+        self.hint_label.grid(row=3, column=0)
+
+    def destroy(self):
+        for name in ('_io_pool', '_metadata_pool'):
+            pool = getattr(self, name, None)
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
 
     def _on_close(self):
         """Handle window close."""
         if self._setup_complete:
             self.destroy()
 
+    def _post(self, fn, *args):
+        """Queue fn(*args) to run on the Tk thread; safe from any thread.
+
+        Only the first post after a drain touches Tk (to schedule the next drain).
+        """
+        self._ui_queue.put((fn, args))
+        with self._ui_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.after(self.UI_QUEUE_INTERVAL_MS, self._drain_ui_queue)
+
+    def _drain_ui_queue(self):
+        """Run every queued callback."""
+        # Cleared first: anything posted from here on arms a new drain
+        with self._ui_lock:
+            self._drain_scheduled = False
+        while True:
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Error in UI callback %s", getattr(fn, '__name__', fn))
+
     def _start_extraction(self):
         """Begin Calibre extraction."""
         extract_async(
@@ -92,7 +170,7 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _on_progress(self, pct, msg):
         """Progress callback (from background thread)."""
-        self.after(0, lambda: self._update_progress(pct, msg))
+        self._post(self._update_progress, pct, msg)
 
     def _update_progress(self, pct, msg):
         """Update progress UI (main thread)."""
@@ -104,7 +182,7 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _on_extraction_complete(self, success, error):
         """Extraction finished (from background thread)."""
-        self.after(0, lambda: self._handle_complete(success, error))
+        self._post(self._handle_complete, success, error)
 
     def _handle_complete(self, success, error):
         """Handle extraction result (main thread)."""
@@ -113,13 +191,13 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
         if success and is_ready():
             self.status_label.configure(text="✓ Setup complete!")
             self.progress_bar.set(1.0)
-            self.progress_bar.configure(progress_color=THEME["success"])
+            self.progress_bar.configure(progress_color=SUCCESS)
             self.hint_label.configure(text="Starting application...")
-            self.after(800, self._transition_to_app)
+            self.after(0, self._transition_to_app)
         else:
             self.status_label.configure(
                 text=f"✗ Setup failed: {error}",
-                text_color=THEME["error"]
+                text_color=ERROR
             )
             self.hint_label.configure(text="Please restart the application.")
             self.protocol("WM_DELETE_WINDOW", self.destroy)
@@ -129,8 +207,8 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
         self.setup_frame.destroy()
 
         # Adaptive sizing based on screen
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
+        screen_width = self._screen_w
+        screen_height = self._screen_h
 
         win_width = min(700, int(screen_width * 0.9))
         win_height = min(800, int(screen_height * 0.85))
@@ -148,66 +226,95 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _build_main_app(self):
         """Build the main application UI inside this window."""
+        self.output_format = config.DEFAULT_OUTPUT_FORMAT
+        self._card_pool = []  # hidden cards of removed tasks, reused by _create_book_card
+        self._backend_ready = False
+        self._early_paths = []  # files added before _init_backend ran, replayed by it
+        self._last_count_text = "0 books"  # what task_count_label currently shows
+        self._count_refresh_posted = False  # a task-list change is already queued
+        # Local file copies for Save to Folder
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="io")
+        # One batch at a time; extract_metadata_batch parallelises internally
+        self._metadata_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metadata")
+
+        # task_id -> (progress, status), written by worker threads and applied by
+        # _flush_updates, which the first update of a burst schedules
+        self._pending_updates = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Latest device from the Kindle monitor thread, applied by _flush_updates
+        self._latest_device = None
+        self._device_dirty = False
+
+        # Build UI
+        self._create_main_widgets()
+
+        # Converter/Kindle/task modules are imported once the window has painted
+        self.after_idle(self._init_backend)
+
+    def _init_backend(self):
+        """Import and start the conversion and Kindle subsystems."""
         from core.converter import Converter
         from core.kindle import KindleManager
         from core.task_manager import TaskManager
-        import config
 
-        # Store references
         self.converter = Converter()
         self.kindle_manager = KindleManager()
         self.task_manager = TaskManager()
-        self.output_format = config.DEFAULT_OUTPUT_FORMAT
-        self.book_cards = {}
-
-        # Build UI
-        self._create_main_widgets()
 
         # Start Kindle monitoring
         self.kindle_manager.add_connection_callback(self._on_kindle_connection_change)
         self.kindle_manager.start_monitoring()
         self.task_manager.add_update_callback(self._refresh_task_list)
+        self._backend_ready = True
+
+        early, self._early_paths = self._early_paths, []
+        if early:
+            self._add_books(early)
 
     def _create_main_widgets(self):
         """Build the main app UI."""
         from ui.components.drop_zone import DropZone
         from ui.components.kindle_status import KindleStatusBar
         from ui.components.format_selector import FormatSelector
-        import config
 
-        # === PACK BOTTOM BAR FIRST so it reserves space ===
-        bottom_bar = ctk.CTkFrame(self, fg_color=THEME["bg_secondary"], height=65)
-        bottom_bar.pack(fill="x", side="bottom")
-        bottom_bar.pack_propagate(False)
+        # Rows: header, Kindle status, drop zone, buttons, list header, task list, bottom bar.
+        # Only the task list stretches; fixed rows get a minsize instead of a frozen frame height.
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, minsize=50)
+        self.grid_rowconfigure(5, weight=1)
+        self.grid_rowconfigure(6, minsize=65)
+
+        # Bottom bar
+        bottom_bar = ctk.CTkFrame(self, fg_color=BG_SECONDARY)
+        bottom_bar.grid(row=6, column=0, sticky="nsew")
 
         self.convert_all_btn = ctk.CTkButton(
             bottom_bar, text="⚡ Convert All", width=140, height=42, corner_radius=10,
-            fg_color=THEME["accent"], hover_color=THEME["accent_hover"],
-            font=ctk.CTkFont(size=14, weight="bold"), command=self._convert_all
+            fg_color=ACCENT, hover_color=ACCENT_HOVER,
+            font=font(14, "bold"), command=self._convert_all
         )
         self.convert_all_btn.pack(side="left", padx=20, pady=11)
 
         self.send_kindle_btn = ctk.CTkButton(
             bottom_bar, text="📲 Send to Kindle", width=150, height=42, corner_radius=10,
-            fg_color=THEME["success"], hover_color=THEME["success_light"],
+            fg_color=SUCCESS, hover_color=SUCCESS_LIGHT,
             text_color="#ffffff", text_color_disabled="#9ca3af",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=font(14, "bold"),
             command=self._send_to_kindle, state="disabled"
         )
         self.send_kindle_btn.pack(side="right", padx=20, pady=11)
 
-        # === NOW PACK EVERYTHING ELSE FROM TOP DOWN ===
-
         # Header
-        header = ctk.CTkFrame(self, fg_color="transparent", height=60)
-        header.pack(fill="x", padx=20, pady=(15, 8))
+        header = ctk.CTkFrame(self, fg_color="transparent")
+        header.grid(row=0, column=0, sticky="ew", padx=20, pady=(15, 8))
         header.grid_columnconfigure(1, weight=1)
 
         ctk.CTkLabel(
             header,
             text="📱 Kindle Sender",
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=THEME["text_primary"]
+            font=font(24, "bold"),
+            text_color=TEXT_PRIMARY
         ).grid(row=0, column=0, sticky="w")
 
         self.format_selector = FormatSelector(header, on_format_change=self._on_format_change)
@@ -215,186 +322,300 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
 
         # Kindle status
         self.kindle_status = KindleStatusBar(self, on_refresh=self._refresh_kindle)
-        self.kindle_status.pack(fill="x", padx=20, pady=8)
+        self.kindle_status.grid(row=1, column=0, sticky="nsew", padx=20, pady=8)
 
         # Drop zone (reduced height)
         self.drop_zone = DropZone(self, on_files_dropped=self._on_files_dropped, height=120)
-        self.drop_zone.pack(fill="x", padx=20, pady=8)
+        self.drop_zone.grid(row=2, column=0, sticky="ew", padx=20, pady=8)
 
         # Buttons row
         btn_row = ctk.CTkFrame(self, fg_color="transparent")
-        btn_row.pack(fill="x", padx=20, pady=8)
+        btn_row.grid(row=3, column=0, sticky="ew", padx=20, pady=8)
 
         ctk.CTkButton(
             btn_row, text="📁 Add Files", width=130, height=36, corner_radius=10,
-            fg_color=THEME["bg_tertiary"], hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=13), command=self._browse_files
+            fg_color=BG_TERTIARY, hover_color=BG_HOVER,
+            font=font(13), command=self._browse_files
         ).pack(side="left", padx=(0, 10))
 
         ctk.CTkButton(
             btn_row, text="💾 Save to Folder", width=140, height=36, corner_radius=10,
-            fg_color=THEME["bg_tertiary"], hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=13), command=self._save_to_folder
+            fg_color=BG_TERTIARY, hover_color=BG_HOVER,
+            font=font(13), command=self._save_to_folder
         ).pack(side="left", padx=(0, 10))
 
         ctk.CTkButton(
             btn_row, text="🗑 Clear Done", width=120, height=36, corner_radius=10,
-            fg_color=THEME["bg_tertiary"], hover_color=THEME["bg_hover"],
-            font=ctk.CTkFont(size=13), command=self._clear_completed
+            fg_color=BG_TERTIARY, hover_color=BG_HOVER,
+            font=font(13), command=self._clear_completed
         ).pack(side="left")
 
         # Task list header
         list_header = ctk.CTkFrame(self, fg_color="transparent")
-        list_header.pack(fill="x", padx=20, pady=(10, 5))
+        list_header.grid(row=4, column=0, sticky="ew", padx=20, pady=(10, 5))
 
         ctk.CTkLabel(
             list_header, text="Books Queue",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=THEME["text_primary"]
+            font=font(16, "bold"),
+            text_color=TEXT_PRIMARY
         ).pack(side="left")
 
         self.task_count_label = ctk.CTkLabel(
             list_header, text="0 books",
-            font=ctk.CTkFont(size=12), text_color=THEME["text_dim"]
+            font=font(12), text_color=TEXT_DIM
         )
         self.task_count_label.pack(side="right")
 
-        # Task list - PACKED LAST so it fills remaining space
+        # Task list - the only stretching row
         self.task_list_frame = ctk.CTkScrollableFrame(
-            self, fg_color=THEME["bg_primary"], corner_radius=0
+            self, fg_color=BG_PRIMARY, corner_radius=0
         )
-        self.task_list_frame.pack(fill="both", expand=True, padx=20, pady=(8, 8))
+        self.task_list_frame.grid(row=5, column=0, sticky="nsew", padx=20, pady=(8, 8))
+
+        # One window-wide wheel handler that scrolls the list canvas directly,
+        # replacing the frame's per-event walk up the widget tree
+        self._scroll_canvas = self.task_list_frame._parent_canvas
+        self.task_list_frame.unbind_all("<MouseWheel>")
+        self.bind_all("<MouseWheel>", self._on_mousewheel)
 
         self.empty_label = ctk.CTkLabel(
             self.task_list_frame,
             text="No books added yet.\nDrag & drop files above or click 'Add Files'",
-            font=ctk.CTkFont(size=14), text_color=THEME["text_dim"], justify="center"
+            font=font(14), text_color=TEXT_DIM, justify="center"
         )
         self.empty_label.pack(pady=40)
 
 
+    # --- Batched progress updates ---
+
+    def _queue_update(self, task_id, progress=None, status=None):
+        """Record a task's latest progress; applied on the next flush (any thread)."""
+        with self._pending_lock:
+            self._pending_updates[task_id] = (progress, status)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Arm _flush_updates unless a flush is already pending (any thread)."""
+        with self._pending_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.after(self.UPDATE_INTERVAL_MS, self._flush_updates)
+
+    def _progress_callback(self, task, status):
+        """Progress callback for task that forwards whole-percent changes,
+        at most one per MIN_PROGRESS_INTERVAL."""
+        last_emit = 0.0
+        last_pct = -1
+
+        def on_progress(progress, *_):
+            nonlocal last_emit, last_pct
+            pct = int(progress)
+            if pct == last_pct:
+                return
+            now = time.monotonic()
+            if pct < 100 and now - last_emit < self.MIN_PROGRESS_INTERVAL:
+                return
+            last_emit = now
+            last_pct = pct
+            self._queue_update(task.id, pct, status)
+
+        return on_progress
+
+    def _discard_update(self, task_id):
+        """Drop a queued update that a final state supersedes."""
+        with self._pending_lock:
+            self._pending_updates.pop(task_id, None)
+
+    def _flush_updates(self):
+        """Apply queued progress and Kindle updates in one pass."""
+        with self._pending_lock:
+            pending, self._pending_updates = self._pending_updates, {}
+            device_dirty, self._device_dirty = self._device_dirty, False
+            device = self._latest_device
+            self._flush_scheduled = False
+        if device_dirty:
+            self._update_kindle_ui(device)
+        for task_id, (progress, status) in pending.items():
+            task = self.task_manager.get_task(task_id)
+            if task is not None and task.card is not None:
+                task.card.set_state(progress, status)
+
     # --- Event Handlers ---
 
+    def _on_mousewheel(self, event):
+        canvas = self._scroll_canvas
+        if canvas.yview() == (0.0, 1.0):
+            return  # everything fits
+        # Same step sizes as CTkScrollableFrame (its canvas scrolls in 1 px units)
+        if sys.platform == "darwin":
+            canvas.yview_scroll(-event.delta, "units")
+        else:
+            canvas.yview_scroll(-int(event.delta / 6), "units")
+
     def _on_format_change(self, fmt):
         self.output_format = fmt
 
     def _on_kindle_connection_change(self, device):
-        self.after(0, lambda: self._update_kindle_ui(device))
+        """Called on the monitor thread; applied by the next _flush_updates."""
+        with self._pending_lock:
+            self._latest_device = device
+            self._device_dirty = True
+        self._schedule_flush()
 
     def _update_kindle_ui(self, device):
         self.kindle_status.update_status(device)
         self.send_kindle_btn.configure(state="normal" if device else "disabled")
 
     def _refresh_kindle(self):
+        if not self._backend_ready:
+            return
         self.kindle_manager.scan()
 
     def _on_files_dropped(self, files):
-        for f in files:
-            self._add_book(f)
+        self._add_books(files)
 
     def _browse_files(self):
-        from tkinter import filedialog
-        import config
-
-        filetypes = [
-            ("Ebook files", " ".join(f"*{ext}" for ext in config.INPUT_FORMATS)),
-            ("All files", "*.*")
-        ]
-        files = filedialog.askopenfilenames(filetypes=filetypes)
-        for f in files:
-            self._add_book(Path(f))
+        files = filedialog.askopenfilenames(filetypes=_FILETYPES)
+        self._add_books([Path(f) for f in files])
 
-    def _add_book(self, file_path):
-        from core.metadata import extract_metadata
+    def _add_books(self, file_paths):
+        """Queue books right away; their metadata is extracted as one batch in the background."""
+        from core.metadata import extract_metadata_batch, placeholder_metadata
         from core.task_manager import BookTask
 
-        metadata = extract_metadata(file_path)
-        task = BookTask.create(metadata, self.output_format)
-        self.task_manager.add_task(task)
-        self._create_book_card(task)
+        if not file_paths:
+            return
+        if not self._backend_ready:
+            self._early_paths.extend(file_paths)
+            return
+
+        # Fill the list while it's hidden so it reflows once, not per book
+        self.empty_label.pack_forget()
+        self.task_list_frame.grid_remove()
+        tasks = []
+        for file_path in file_paths:
+            task = BookTask.create(placeholder_metadata(Path(file_path)), self.output_format)
+            self.task_manager.add_task(task)
+            self._create_book_card(task)
+            tasks.append(task)
+        self.task_list_frame.grid()
+        self._update_task_count()
+
+        future = self._metadata_pool.submit(extract_metadata_batch, file_paths)
+        future.add_done_callback(partial(self._metadata_finished, tasks))
+
+    def _metadata_finished(self, tasks, future):
+        """Metadata batch done (from the metadata pool)."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error:
+            logger.error("Metadata extraction failed", exc_info=error)
+            return
+        self._post(self._apply_metadata, tasks, future.result())
+
+    def _apply_metadata(self, tasks, results):
+        """Swap the placeholder metadata for the extracted metadata (main thread)."""
+        for task, metadata in zip(tasks, results):
+            task.metadata = metadata
+            if task.card is not None:
+                task.card.set_metadata(metadata)
 
     def _create_book_card(self, task):
         from ui.components.book_card import BookCard
 
-        self.empty_label.pack_forget()
-
-        card = BookCard(self.task_list_frame, task, on_remove=self._remove_task)
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.rebind(task)
+        else:
+            card = BookCard(self.task_list_frame, task, on_remove=self._remove_task,
+                            set_status=self.task_manager.set_status)
         card.pack(fill="x", pady=5)
-        self.book_cards[task.id] = card
-        self._update_task_count()
+        task.card = card
+
+    def _release_card(self, task_id):
+        """Hide a task's card and keep it for reuse."""
+        task = self.task_manager.get_task(task_id)
+        if task is None or task.card is None:
+            return
+        # Worker callbacks reach the card through task.card, so once it's
+        # cleared even a running task's card is free to be reused
+        card, task.card = task.card, None
+        if len(self._card_pool) >= self.CARD_POOL_SIZE:
+            card.destroy()
+        else:
+            card.pack_forget()
+            self._card_pool.append(card)
+
+    def _fail_task(self, task, message):
+        """Mark task failed and show it on its card, if it still has one."""
+        from core.task_manager import TaskStatus
+
+        self.task_manager.set_status(task, TaskStatus.FAILED)
+        task.error_message = message
+        if task.card is not None:
+            task.card.update_status(TaskStatus.FAILED, message)
+
+    def _finish_task(self, task, status):
+        """Move task to an end-of-step status and show it on its card, if any."""
+        self.task_manager.set_status(task, status)
+        if task.card is not None:
+            task.card.finalize(status)
 
     def _remove_task(self, task_id):
-        if task_id in self.book_cards:
-            self.book_cards[task_id].destroy()
-            del self.book_cards[task_id]
-        self.task_manager.remove_task(task_id)
+        self._remove_task_batch([task_id])
+
+    def _remove_task_batch(self, task_ids):
+        """Remove several tasks and their cards, relabelling the list once."""
+        for task_id in task_ids:
+            self._release_card(task_id)
+        self.task_manager.remove_tasks(task_ids)
         self._update_task_count()
 
-        if not self.book_cards:
+        if not self.task_manager.tasks:
             self.empty_label.pack(pady=40)
 
     def _update_task_count(self):
         count = len(self.task_manager.tasks)
-        self.task_count_label.configure(text=f"{count} book{'s' if count != 1 else ''}")
+        text = f"{count} book{'s' if count != 1 else ''}"
+        if text == self._last_count_text:
+            return
+        self._last_count_text = text
+        self.task_count_label.configure(text=text)
 
     def _refresh_task_list(self):
-        self.after(0, self._update_task_count)
+        """Relabel the task count once per burst of task-list changes."""
+        if self._count_refresh_posted:
+            return
+        self._count_refresh_posted = True
+        self._post(self._flush_task_count)
+
+    def _flush_task_count(self):
+        self._count_refresh_posted = False
+        self._update_task_count()
 
     def _convert_all(self):
         from core.task_manager import TaskStatus
 
-        pending = [t for t in self.task_manager.get_all_tasks() if t.status == TaskStatus.QUEUED]
-        for task in pending:
+        if not self._backend_ready:
+            return
+
+        for task in self.task_manager.iter_by_status(TaskStatus.QUEUED):
             self._convert_task(task)
 
     def _convert_task(self, task, then_send=False):
         """Convert a single task."""
         from core.task_manager import TaskStatus
 
-        card = self.book_cards.get(task.id)
-        if not card:
+        card = task.card
+        if card is None:
             return
 
-        def on_progress(progress, message):
-            self.after(0, lambda: card.update_progress(progress, TaskStatus.CONVERTING))
-
-        def on_complete(result, error):
-            def update():
-                try:
-                    if error:
-                        task.status = TaskStatus.FAILED
-                        task.error_message = str(error)
-                        card.update_status(TaskStatus.FAILED, str(error))
-                    else:
-                        # Handle ConversionResult object
-                        if hasattr(result, 'output_path'):
-                            task.converted_path = result.output_path
-                            task.cover_path = getattr(result, 'cover_path', None)
-                            task.mobi_asin = getattr(result, 'mobi_asin', None)
-                        else:
-                            task.converted_path = Path(result) if result else None
-                            task.cover_path = None
-                            task.mobi_asin = None
-
-                        task.status = TaskStatus.CONVERTED
-                        card.update_progress(100, TaskStatus.CONVERTED)
-                        card.update_status(TaskStatus.CONVERTED)
-
-                        if then_send and self.kindle_manager.is_connected:
-                            self._transfer_task(task)
-                except Exception as e:
-                    print(f"Error in conversion completion handler: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    task.status = TaskStatus.FAILED
-                    task.error_message = str(e)
-                    card.update_status(TaskStatus.FAILED, str(e))
-
-            self.after(0, update)
-
-        task.status = TaskStatus.CONVERTING
-        card.update_status(TaskStatus.CONVERTING)
-        card.update_progress(0, TaskStatus.CONVERTING)
+        on_progress = self._progress_callback(task, TaskStatus.CONVERTING)
+
+        self.task_manager.set_status(task, TaskStatus.CONVERTING)
+        card.set_state(0, TaskStatus.CONVERTING)
 
         output_format = "azw3" if then_send else self.output_format
 
@@ -402,42 +623,54 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
             task.metadata.file_path,
             output_format,
             progress_callback=on_progress,
-            completion_callback=on_complete
+            completion_callback=partial(self._on_convert_complete, task, then_send)
         )
 
+    def _on_convert_complete(self, task, then_send, result, error):
+        """Conversion finished (from worker thread)."""
+        self._post(self._apply_convert_result, task, then_send, result, error)
+
+    def _apply_convert_result(self, task, then_send, result, error):
+        """Record a conversion result (main thread)."""
+        from core.task_manager import TaskStatus
+
+        self._discard_update(task.id)
+        try:
+            if error:
+                self._fail_task(task, str(error))
+            else:
+                # Handle ConversionResult object
+                if hasattr(result, 'output_path'):
+                    task.converted_path = result.output_path
+                    task.cover_path = getattr(result, 'cover_path', None)
+                    task.mobi_asin = getattr(result, 'mobi_asin', None)
+                else:
+                    task.converted_path = Path(result) if result else None
+                    task.cover_path = None
+                    task.mobi_asin = None
+
+                self._finish_task(task, TaskStatus.CONVERTED)
+
+                if then_send and self.kindle_manager.is_connected:
+                    self._transfer_task(task)
+        except Exception as e:
+            logger.exception("Error in conversion completion handler")
+            self._fail_task(task, str(e))
+
     def _transfer_task(self, task):
         """Transfer a converted book to Kindle."""
         from core.task_manager import TaskStatus
 
-        card = self.book_cards.get(task.id)
-        if not card:
+        card = task.card
+        if card is None:
             return
 
-        def on_progress(progress):
-            self.after(0, lambda: card.update_progress(progress, TaskStatus.TRANSFERRING))
-
-        def on_complete(success, error):
-            def update():
-                try:
-                    if error:
-                        task.status = TaskStatus.FAILED
-                        task.error_message = str(error)
-                        card.update_status(TaskStatus.FAILED, str(error))
-                    else:
-                        task.status = TaskStatus.COMPLETED
-                        card.update_progress(100, TaskStatus.COMPLETED)
-                        card.update_status(TaskStatus.COMPLETED)
-                except Exception as e:
-                    print(f"Error in transfer completion handler: {e}")
-                    task.status = TaskStatus.FAILED
-                    card.update_status(TaskStatus.FAILED, str(e))
-
-            self.after(0, update)
-
-        task.status = TaskStatus.TRANSFERRING
+        on_progress = self._progress_callback(task, TaskStatus.TRANSFERRING)
+
+        self.task_manager.set_status(task, TaskStatus.TRANSFERRING)
         card.update_status(TaskStatus.TRANSFERRING)
 
-        # Get cover and mobi_asin for thumbnail creation (FIXED: use mobi_asin not book_uuid)
+        # Get cover and mobi_asin for thumbnail creation
         cover_path = getattr(task, 'cover_path', None)
         mobi_asin = getattr(task, 'mobi_asin', None)
 
@@ -445,43 +678,56 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
             self.kindle_manager.transfer_file_async(
                 task.converted_path,
                 cover_path=cover_path,
-                mobi_asin=mobi_asin,  # FIXED: was book_uuid
+                mobi_asin=mobi_asin,
                 progress_callback=on_progress,
-                completion_callback=on_complete
+                completion_callback=partial(self._on_transfer_complete, task)
             )
         except Exception as e:
-            print(f"Failed to start transfer: {e}")
-            import traceback
-            traceback.print_exc()
-            task.status = TaskStatus.FAILED
-            task.error_message = str(e)
-            card.update_status(TaskStatus.FAILED, str(e))
+            logger.exception("Failed to start transfer")
+            self._fail_task(task, str(e))
+
+    def _on_transfer_complete(self, task, success, error):
+        """Transfer finished (from worker thread)."""
+        self._post(self._apply_transfer_result, task, success, error)
+
+    def _apply_transfer_result(self, task, success, error):
+        """Record a transfer result (main thread)."""
+        from core.task_manager import TaskStatus
+
+        self._discard_update(task.id)
+        try:
+            if error:
+                self._fail_task(task, str(error))
+            else:
+                self._finish_task(task, TaskStatus.COMPLETED)
+        except Exception as e:
+            logger.exception("Error in transfer completion handler")
+            self._fail_task(task, str(e))
 
     def _send_to_kindle(self):
         """Send books to Kindle - auto-converts if needed."""
         from core.task_manager import TaskStatus
 
-        if not self.kindle_manager.is_connected:
+        if not self._backend_ready or not self.kindle_manager.is_connected:
             return
 
-        for task in self.task_manager.get_all_tasks():
-            if task.status == TaskStatus.COMPLETED:
-                continue
-            elif task.status == TaskStatus.CONVERTED and task.converted_path:
+        for task in self.task_manager.iter_by_status(TaskStatus.CONVERTED, TaskStatus.QUEUED):
+            if task.status == TaskStatus.CONVERTED and task.converted_path:
                 if task.converted_path.suffix.lower() == '.azw3':
                     self._transfer_task(task)
                 else:
                     # Need to re-convert to AZW3
-                    task.status = TaskStatus.QUEUED
+                    self.task_manager.set_status(task, TaskStatus.QUEUED)
                     self._convert_task(task, then_send=True)
             elif task.status == TaskStatus.QUEUED:
                 self._convert_task(task, then_send=True)
 
     def _save_to_folder(self):
         """Save converted files to a chosen folder."""
-        from tkinter import filedialog
         from core.task_manager import TaskStatus
-        import shutil
+
+        if not self._backend_ready:
+            return
 
         folder = filedialog.askdirectory(title="Select destination folder")
         if not folder:
@@ -489,85 +735,92 @@ class Launcher(ctk.CTk, TkinterDnD.DnDWrapper):
 
         folder = Path(folder)
 
-        for task in self.task_manager.get_all_tasks():
+        for task in self.task_manager.iter_by_status(TaskStatus.CONVERTED, TaskStatus.QUEUED):
             if task.status == TaskStatus.CONVERTED and task.converted_path:
-                dest = folder / task.converted_path.name
-                shutil.copy2(task.converted_path, dest)
-                task.status = TaskStatus.COMPLETED
-                card = self.book_cards.get(task.id)
-                if card:
-                    card.update_progress(100, TaskStatus.COMPLETED)
-                    card.update_status(TaskStatus.COMPLETED)
+                self._copy_to_folder(task, task.converted_path, folder)
 
             elif task.status == TaskStatus.QUEUED:
                 self._convert_and_save(task, folder)
 
+    def _copy_to_folder(self, task, src, folder):
+        """Copy a converted file into folder on the io pool."""
+        future = self._io_pool.submit(shutil.copy2, src, folder / src.name)
+        future.add_done_callback(partial(self._copy_finished, task))
+
+    def _copy_finished(self, task, future):
+        """Copy done (from the io pool)."""
+        if not future.cancelled():
+            self._post(self._on_copy_done, task, future.exception())
+
+    def _on_copy_done(self, task, error):
+        """Mark a saved task done or failed (main thread)."""
+        from core.task_manager import TaskStatus
+
+        if error:
+            logger.warning("Failed to save %s", task.metadata.file_path.name, exc_info=error)
+            self._fail_task(task, str(error))
+        else:
+            self._finish_task(task, TaskStatus.COMPLETED)
+
     def _convert_and_save(self, task, folder):
         """Convert a task and save to folder."""
         from core.task_manager import TaskStatus
-        import shutil
 
-        card = self.book_cards.get(task.id)
-        if not card:
+        card = task.card
+        if card is None:
             return
 
-        def on_progress(progress, message):
-            self.after(0, lambda: card.update_progress(progress, TaskStatus.CONVERTING))
-
-        def on_complete(result, error):
-            def update():
-                try:
-                    if error:
-                        task.status = TaskStatus.FAILED
-                        task.error_message = str(error)
-                        card.update_status(TaskStatus.FAILED, str(error))
-                    else:
-                        # Handle ConversionResult object
-                        if hasattr(result, 'output_path'):
-                            output_path = result.output_path
-                            task.cover_path = getattr(result, 'cover_path', None)
-                        else:
-                            # Fallback for plain Path
-                            output_path = Path(result) if result else None
-                            task.cover_path = None
-
-                        if output_path and output_path.exists():
-                            dest = folder / output_path.name
-                            shutil.copy2(output_path, dest)
-                            task.converted_path = output_path
-                            task.status = TaskStatus.COMPLETED
-                            card.update_progress(100, TaskStatus.COMPLETED)
-                            card.update_status(TaskStatus.COMPLETED)
-                        else:
-                            task.status = TaskStatus.FAILED
-                            task.error_message = "Output file not found"
-                            card.update_status(TaskStatus.FAILED, "Output file not found")
-                except Exception as e:
-                    print(f"Error in save completion handler: {e}")
-                    task.status = TaskStatus.FAILED
-                    task.error_message = str(e)
-                    card.update_status(TaskStatus.FAILED, str(e))
-
-            self.after(0, update)
-
-        task.status = TaskStatus.CONVERTING
-        card.update_status(TaskStatus.CONVERTING)
-        card.update_progress(0, TaskStatus.CONVERTING)
+        on_progress = self._progress_callback(task, TaskStatus.CONVERTING)
+
+        self.task_manager.set_status(task, TaskStatus.CONVERTING)
+        card.set_state(0, TaskStatus.CONVERTING)
 
         self.converter.convert_async(
             task.metadata.file_path,
             self.output_format,
             progress_callback=on_progress,
-            completion_callback=on_complete
+            completion_callback=partial(self._on_save_complete, task, folder)
         )
 
+    def _on_save_complete(self, task, folder, result, error):
+        """Conversion for saving finished (from worker thread)."""
+        self._post(self._apply_save_result, task, folder, result, error)
+
+    def _apply_save_result(self, task, folder, result, error):
+        """Copy the converted book to folder, or record the failure (main thread)."""
+        self._discard_update(task.id)
+        try:
+            if error:
+                self._fail_task(task, str(error))
+            else:
+                # Handle ConversionResult object
+                if hasattr(result, 'output_path'):
+                    output_path = result.output_path
+                    task.cover_path = getattr(result, 'cover_path', None)
+                else:
+                    # Fallback for plain Path
+                    output_path = Path(result) if result else None
+                    task.cover_path = None
+
+                if output_path and output_path.exists():
+                    task.converted_path = output_path
+                    self._copy_to_folder(task, output_path, folder)
+                else:
+                    self._fail_task(task, "Output file not found")
+        except Exception as e:
+            logger.exception("Error in save completion handler")
+            self._fail_task(task, str(e))
+
     def _clear_completed(self):
         """Remove completed tasks from the list."""
         from core.task_manager import TaskStatus
 
+        if not self._backend_ready:
+            return
+
         to_remove = [
-            tid for tid, card in self.book_cards.items()
-            if card.task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
+            task.id for task in self.task_manager.iter_by_status(TaskStatus.COMPLETED, TaskStatus.FAILED)
         ]
-        for tid in to_remove:
-            self._remove_task(tid)
\ No newline at end of file
+        if to_remove:
+            self._remove_task_batch(to_remove)
+            self.task_list_frame.update_idletasks()
\ No newline at end of file
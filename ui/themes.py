@@ -1,4 +1,8 @@
 """Theme configuration for the app."""
+import functools
+from types import MappingProxyType
+
+import customtkinter as ctk
 
 DARK_THEME = {
     "bg_primary": "#0f0f1a",
@@ -56,5 +60,26 @@ LIGHT_THEME = {
     "progress_fill": "#6366f1",
 }
 
-# Use dark theme by default
-THEME = DARK_THEME
\ No newline at end of file
+# Use dark theme by default; read-only so every module can share it
+THEME = MappingProxyType(DARK_THEME)
+
+# Frequently used colors as plain module constants
+BG_PRIMARY = THEME["bg_primary"]
+BG_SECONDARY = THEME["bg_secondary"]
+BG_TERTIARY = THEME["bg_tertiary"]
+BG_HOVER = THEME["bg_hover"]
+ACCENT = THEME["accent"]
+ACCENT_HOVER = THEME["accent_hover"]
+SUCCESS = THEME["success"]
+SUCCESS_LIGHT = THEME["success_light"]
+ERROR = THEME["error"]
+TEXT_PRIMARY = THEME["text_primary"]
+TEXT_SECONDARY = THEME["text_secondary"]
+TEXT_DIM = THEME["text_dim"]
+PROGRESS_BG = THEME["progress_bg"]
+
+
+@functools.lru_cache(maxsize=None)
+def font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Shared CTkFont for a size/weight; call only once a root window exists."""
+    return ctk.CTkFont(size=size, weight=weight)